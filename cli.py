@@ -4,22 +4,112 @@ Command Line Interface for OrcaSlicer Configuration Backup Tool
 
 import os
 import sys
+import glob
+import time
 from pathlib import Path
-from orca_backup import OrcaBackup
-from utils import format_file_size
+from utils import format_file_size, scan_tree
+
+# Banners are built once at import time rather than on every redraw
+_RULE_60 = "=" * 60
+_RULE_50 = "=" * 50
+_RULE_40 = "=" * 40
+_DASH_40 = "-" * 40
+
+_HEADER = "\n".join([
+    _RULE_60,
+    "     OrcaSlicer Configuration Backup & Restore Tool",
+    _RULE_60,
+]) + "\n"
+
+_MENU = "\n".join([
+    "\n" + _DASH_40,
+    "Main Menu:",
+    "1. Export configuration to zip file",
+    "2. Import configuration from zip file",
+    "3. Show configuration details",
+    "4. Exit",
+    _DASH_40,
+]) + "\n"
+
+_DETAILS_BANNER = f"\n{_RULE_50}\nDetailed Configuration Information\n{_RULE_50}\n"
+_EXPORT_BANNER = f"\n{_RULE_40}\nExport Configuration\n{_RULE_40}\n"
+_IMPORT_BANNER = f"\n{_RULE_40}\nImport Configuration\n{_RULE_40}\n"
 
 class CLIInterface:
     """Command line interface for the backup tool"""
     
     def __init__(self):
-        self.backup_tool = OrcaBackup()
+        self._backup_tool = None
+        self._info_cache = None
+        self._info_cache_ts = 0.0
+        
+    @property
+    def backup_tool(self):
+        """OrcaBackup instance, created on first use"""
+        if self._backup_tool is None:
+            from orca_backup import OrcaBackup
+            self._backup_tool = OrcaBackup.shared()
+        return self._backup_tool
+    
+    def _info(self, max_age=5.0):
+        """Get configuration info, reusing a recent result if available"""
+        now = time.monotonic()
+        if self._info_cache is None or now - self._info_cache_ts > max_age:
+            self._info_cache = self.backup_tool.get_config_info()
+            self._info_cache_ts = now
+        return self._info_cache
+        
+    def _setup_readline(self):
+        """Enable line editing, history and path completion for prompts"""
+        try:
+            import readline
+        except ImportError:
+            return
+        
+        readline.set_completer_delims(' \t\n')
+        readline.parse_and_bind('tab: complete')
+        readline.set_completer(self._complete_path)
+        
+        # Only load history for real terminal sessions
+        if not sys.stdin.isatty():
+            return
+        
+        history_file = Path.home() / ".orcaslicer_manager" / "cli_history"
+        try:
+            readline.read_history_file(history_file)
+        except OSError:
+            pass
+        readline.set_history_length(500)
+        
+        def save_history():
+            try:
+                history_file.parent.mkdir(exist_ok=True)
+                readline.write_history_file(history_file)
+            except OSError:
+                pass
+        
+        import atexit
+        atexit.register(save_history)
+    
+    def _complete_path(self, text, state):
+        """Readline completer for file paths"""
+        if state == 0:
+            matches = glob.glob(os.path.expanduser(text) + '*')
+            self._completion_matches = [
+                m + os.sep if os.path.isdir(m) else m for m in sorted(matches)
+            ]
+        try:
+            return self._completion_matches[state]
+        except (AttributeError, IndexError):
+            return None
         
     def run_interactive(self):
         """Run interactive CLI mode"""
+        self._setup_readline()
         self.print_header()
         
         # Check installation status
-        info = self.backup_tool.get_config_info()
+        info = self._info()
         self.display_status(info)
         
         if not info['config_found']:
@@ -46,63 +136,63 @@ class CLIInterface:
     
     def print_header(self):
         """Print application header"""
-        print("=" * 60)
-        print("     OrcaSlicer Configuration Backup & Restore Tool")
-        print("=" * 60)
+        sys.stdout.write(_HEADER)
     
     def print_menu(self):
         """Print main menu"""
-        print("\n" + "-" * 40)
-        print("Main Menu:")
-        print("1. Export configuration to zip file")
-        print("2. Import configuration from zip file")
-        print("3. Show configuration details")
-        print("4. Exit")
-        print("-" * 40)
+        sys.stdout.write(_MENU)
     
     def display_status(self, info):
         """Display current OrcaSlicer status"""
-        print("\nCurrent Status:")
-        print(f"  Installation found: {'Yes' if info['installation_found'] else 'No'}")
+        lines = ["\nCurrent Status:"]
+        lines.append(f"  Installation found: {'Yes' if info['installation_found'] else 'No'}")
         if info['installation_path']:
-            print(f"  Installation path:  {info['installation_path']}")
+            lines.append(f"  Installation path:  {info['installation_path']}")
         
-        print(f"  Configuration found: {'Yes' if info['config_found'] else 'No'}")
+        lines.append(f"  Configuration found: {'Yes' if info['config_found'] else 'No'}")
         if info['config_path']:
-            print(f"  Configuration path:  {info['config_path']}")
+            lines.append(f"  Configuration path:  {info['config_path']}")
             if info['config_found']:
-                print(f"  Configuration size:  {format_file_size(info['config_size'])}")
-                print(f"  Number of files:     {info['file_count']}")
+                lines.append(f"  Configuration size:  {format_file_size(info['config_size'])}")
+                lines.append(f"  Number of files:     {info['file_count']}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def display_detailed_info(self):
         """Display detailed configuration information"""
-        print("\n" + "=" * 50)
-        print("Detailed Configuration Information")
-        print("=" * 50)
+        sys.stdout.write(_DETAILS_BANNER)
         
-        info = self.backup_tool.get_config_info()
+        info = self._info()
         self.display_status(info)
         
         if info['config_found']:
-            config_path = Path(info['config_path'])
+            config_path = info['config_path']
             print(f"\nConfiguration directory contents:")
             
+            lines = []
             try:
-                for item in sorted(config_path.iterdir()):
-                    if item.is_file():
-                        size = format_file_size(item.stat().st_size)
-                        print(f"  📄 {item.name} ({size})")
-                    elif item.is_dir():
-                        file_count = sum(1 for _ in item.rglob('*') if _.is_file())
-                        print(f"  📁 {item.name}/ ({file_count} files)")
+                with os.scandir(config_path) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+                
+                for entry in entries:
+                    # Follow links like export does; symlinked directories are
+                    # not backed up, so they are left out as in scan_tree
+                    if entry.is_file():
+                        size = format_file_size(entry.stat().st_size)
+                        lines.append(f"  📄 {entry.name} ({size})")
+                    elif entry.is_dir() and not entry.is_symlink():
+                        file_count, total_size = scan_tree(entry.path)
+                        lines.append(f"  📁 {entry.name}/ ({file_count} files, "
+                                     f"{format_file_size(total_size)})")
             except Exception as e:
-                print(f"  Error reading directory: {e}")
+                lines.append(f"  Error reading directory: {e}")
+            
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
     
     def interactive_export(self):
         """Interactive export process"""
-        print("\n" + "=" * 40)
-        print("Export Configuration")
-        print("=" * 40)
+        sys.stdout.write(_EXPORT_BANNER)
         
         # Get output filename
         while True:
@@ -116,7 +206,11 @@ class CLIInterface:
                 filename += '.zip'
             
             # Check if file exists
-            if Path(filename).exists():
+            try:
+                os.stat(filename)
+            except FileNotFoundError:
+                pass
+            else:
                 overwrite = input(f"File '{filename}' already exists. Overwrite? (y/N): ").lower().strip()
                 if overwrite != 'y':
                     continue
@@ -127,9 +221,7 @@ class CLIInterface:
     
     def interactive_import(self):
         """Interactive import process"""
-        print("\n" + "=" * 40)
-        print("Import Configuration")
-        print("=" * 40)
+        sys.stdout.write(_IMPORT_BANNER)
         
         # Get input filename
         while True:
@@ -139,21 +231,28 @@ class CLIInterface:
                 print("Please enter a filename.")
                 continue
             
-            if not Path(filename).exists():
+            try:
+                backup_handle = open(filename, 'rb')
+            except FileNotFoundError:
                 print(f"File '{filename}' not found.")
                 continue
+            except OSError as e:
+                print(f"Cannot open '{filename}': {e}")
+                continue
             
             break
         
-        # Show backup info
-        validator = self.backup_tool.validator
-        backup_info = validator.get_backup_info(filename)
-        
-        if backup_info:
-            print("\nBackup file information:")
-            for key, value in backup_info.items():
-                if key != 'error':
-                    print(f"  {key}: {value}")
+        # Show backup info only if requested, so declining skips the zip parse
+        with backup_handle:
+            preview = input("Preview backup file information? (Y/n): ").lower().strip()
+            if preview != 'n':
+                validator = self.backup_tool.validator
+                backup_info = validator.get_backup_info(backup_handle)
+                
+                if backup_info:
+                    body = "\n".join(f"  {key}: {value}"
+                                      for key, value in backup_info.items() if key != 'error')
+                    sys.stdout.write(f"\nBackup file information:\n{body}\n")
         
         # Confirm import
         print(f"\nThis will replace your current OrcaSlicer configuration with the backup from:")
@@ -178,15 +277,18 @@ class CLIInterface:
             success = self.backup_tool.export_configuration(filename)
             
             if success:
-                file_size = format_file_size(Path(filename).stat().st_size)
+                file_size = format_file_size(os.stat(filename).st_size)
                 print(f"✅ Export successful!")
                 print(f"   File: {filename}")
                 print(f"   Size: {file_size}")
             else:
                 print("❌ Export failed.")
+            
+            return success
                 
         except Exception as e:
             print(f"❌ Export failed: {e}")
+            return False
     
     def import_config(self, filename, create_backup=True):
         """Import configuration from file"""
@@ -196,23 +298,49 @@ class CLIInterface:
             success = self.backup_tool.import_configuration(filename, create_backup)
             
             if success:
+                self._info_cache = None
                 print("✅ Import successful!")
                 print("   Your OrcaSlicer configuration has been restored.")
                 print("   Please restart OrcaSlicer to see the changes.")
             else:
                 print("❌ Import failed.")
+            
+            return success
                 
         except Exception as e:
             print(f"❌ Import failed: {e}")
+            return False
     
     def get_timestamp(self):
         """Get timestamp string for filenames"""
-        from datetime import datetime
-        return datetime.now().strftime("%Y%m%d_%H%M%S")
+        return time.strftime("%Y%m%d_%H%M%S")
 
-def main():
+def main(argv=None):
     """Main entry point for CLI"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="OrcaSlicer Configuration Backup & Restore Tool"
+    )
+    subparsers = parser.add_subparsers(dest='command')
+    
+    export_parser = subparsers.add_parser('export', help="Export configuration to a zip file")
+    export_parser.add_argument('file', help="Output zip file path")
+    
+    import_parser = subparsers.add_parser('import', help="Import configuration from a zip file")
+    import_parser.add_argument('file', help="Backup zip file path")
+    import_parser.add_argument('--no-backup', action='store_true',
+                               help="Do not back up the current configuration first")
+    
+    args = parser.parse_args(argv)
     cli = CLIInterface()
+    
+    # Scripted use skips the menu loop and readline setup entirely
+    if args.command == 'export':
+        sys.exit(0 if cli.export_config(args.file) else 1)
+    elif args.command == 'import':
+        sys.exit(0 if cli.import_config(args.file, not args.no_backup) else 1)
+    
     cli.run_interactive()
 
 if __name__ == "__main__":
@@ -9,53 +9,219 @@ import tkinter as tk
 from tkinter import messagebox, simpledialog
 from pathlib import Path
 import tempfile
-import shutil
 import webbrowser
-from datetime import datetime
+from datetime import datetime, timezone
 import threading
+import time
+import collections
 import subprocess
 import sys
+from operator import itemgetter
 
 try:
     from google.auth.transport.requests import Request
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
     from googleapiclient.discovery import build
-    from googleapiclient.http import MediaIoBaseDownload, MediaFileUpload
+    from googleapiclient.errors import HttpError
+    from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
+    from google_auth_httplib2 import AuthorizedHttp
+    import httplib2
     GOOGLE_DRIVE_AVAILABLE = True
 except ImportError:
     GOOGLE_DRIVE_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_loads(data):
+    """Decode JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj):
+    """Encode an object as compact JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# Buffer size used when copying backups to and from local cloud folders
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Backups smaller than this are sent to Google Drive in a single non-resumable request
+SIMPLE_UPLOAD_LIMIT = 5 * 1024 * 1024
+
+# Chunk size for resumable Google Drive uploads
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Backups built for upload stay in memory up to this size before spilling to disk
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# Deflate level for backups created for upload; smaller payloads upload faster
+UPLOAD_COMPRESSLEVEL = 9
+
+# Socket timeout in seconds for the Google Drive HTTP transport
+HTTP_TIMEOUT = 60
+
+# Interval in milliseconds between sync log flushes to the Text widget
+LOG_FLUSH_INTERVAL_MS = 100
+
+# Cached Google credentials are refreshed once they are this close to expiry (seconds)
+TOKEN_REFRESH_MARGIN = 300
+
+def _preallocate(fd, size):
+    """Reserve disk space for a file about to be written, if the platform supports it"""
+    if size <= 0:
+        return
+    
+    try:
+        if hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(fd, 0, size)
+        elif sys.platform == 'darwin':
+            import fcntl
+            import struct
+            # fstore_t: flags, posmode, offset, length, bytesalloc
+            F_PREALLOCATE = getattr(fcntl, 'F_PREALLOCATE', 42)
+            F_ALLOCATECONTIG, F_ALLOCATEALL, F_PEOFPOSMODE = 0x2, 0x4, 3
+            try:
+                store = struct.pack('Iiqqq', F_ALLOCATECONTIG | F_ALLOCATEALL, F_PEOFPOSMODE, 0, size, 0)
+                fcntl.fcntl(fd, F_PREALLOCATE, store)
+            except OSError:
+                # Contiguous space unavailable; settle for any extents
+                store = struct.pack('Iiqqq', F_ALLOCATEALL, F_PEOFPOSMODE, 0, size, 0)
+                fcntl.fcntl(fd, F_PREALLOCATE, store)
+    except OSError:
+        # Preallocation is only an optimization
+        pass
+
+def _stream_copy(source_path, dest_path, buffer_size=COPY_BUFFER_SIZE):
+    """
+    Copy a file using os.sendfile where supported, falling back to large buffered reads
+    
+    Args:
+        source_path: File to copy from
+        dest_path: File to copy to
+        buffer_size (int): Read size for the buffered fallback
+    """
+    with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
+        src_stat = os.fstat(src.fileno())
+        offset = 0
+        _preallocate(dst.fileno(), src_stat.st_size)
+        
+        if hasattr(os, 'sendfile'):
+            try:
+                while offset < src_stat.st_size:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), offset, src_stat.st_size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                # Not supported for this file pair (e.g. macOS needs a socket target)
+                pass
+        
+        src.seek(offset)
+        dst.seek(offset)
+        while True:
+            chunk = src.read(buffer_size)
+            if not chunk:
+                break
+            dst.write(chunk)
+        
+        # Drop any preallocated space the source didn't fill
+        dst.truncate()
+    
+    os.utime(dest_path, (src_stat.st_atime, src_stat.st_mtime))
+
+class CredentialStore:
+    """Stored cloud credential flags, shared by all cloud storage managers"""
+    
+    _shared = None
+    
+    def __init__(self, credentials_file):
+        self.credentials_file = Path(credentials_file)
+        self.credentials = {}
+        self.dirty = False
+        self.credentials_file.parent.mkdir(exist_ok=True)
+        self.load()
+    
+    @classmethod
+    def shared(cls):
+        """Get the process-wide store for the default credentials file"""
+        if cls._shared is None:
+            cls._shared = cls(Path.home() / ".orcaslicer_manager" / "credentials.json")
+        return cls._shared
+    
+    def load(self):
+        """Load stored credentials from file"""
+        if self.credentials_file.exists():
+            try:
+                data = _json_loads(self.credentials_file.read_bytes())
+                self.credentials.clear()
+                self.credentials.update(data.get('credentials', {}))
+            except Exception:
+                pass
+    
+    def set(self, key, value):
+        """Update a credential flag, marking the store dirty if it changed"""
+        if self.credentials.get(key) != value:
+            self.credentials[key] = value
+            self.dirty = True
+    
+    def save(self):
+        """Save credentials to file if they changed, replacing it atomically"""
+        if not self.dirty:
+            return
+        
+        tmp_file = self.credentials_file.with_suffix('.tmp')
+        tmp_file.write_bytes(_json_dumps({'credentials': self.credentials}))
+        os.replace(tmp_file, self.credentials_file)
+        self.dirty = False
+
 class CloudStorageManager:
     """Manages cloud storage authentication and operations"""
     
     def __init__(self, gui_parent=None):
         self.gui_parent = gui_parent
-        self.credentials = {}
+        self._store = CredentialStore.shared()
+        self.credentials = self._store.credentials
         self.services = {}
         self.app_folder = "OrcaSlicer Config Manager"
-        self.credentials_file = Path.home() / ".orcaslicer_manager" / "credentials.json"
-        self.credentials_file.parent.mkdir(exist_ok=True)
-        self.load_credentials()
+        self.credentials_file = self._store.credentials_file
+    
+    def _ui_message(self, show, title, message):
+        """Show a message box on the Tk thread, even when called from a worker thread"""
+        if self.gui_parent is not None:
+            self.gui_parent.after(0, lambda: show(title, message))
+        else:
+            show(title, message)
+    
+    def _ui_error(self, title, message):
+        """Show an error message box on the Tk thread"""
+        self._ui_message(messagebox.showerror, title, message)
+    
+    def _ui_info(self, title, message):
+        """Show an information message box on the Tk thread"""
+        self._ui_message(messagebox.showinfo, title, message)
         
     def load_credentials(self):
-        """Load stored credentials from file"""
-        if self.credentials_file.exists():
-            try:
-                with open(self.credentials_file, 'r') as f:
-                    data = json.load(f)
-                    self.credentials = data.get('credentials', {})
-            except Exception:
-                pass
+        """Reload stored credentials from file"""
+        self._store.load()
+    
+    def set_credential(self, key, value):
+        """Update a stored credential flag, marking the file for saving if it changed"""
+        self._store.set(key, value)
     
     def save_credentials(self):
-        """Save credentials to file"""
+        """Save credentials to file if they changed"""
         try:
-            with open(self.credentials_file, 'w') as f:
-                json.dump({'credentials': self.credentials}, f)
+            self._store.save()
         except Exception as e:
             if self.gui_parent:
-                messagebox.showerror("Error", f"Failed to save credentials: {e}")
+                self._ui_error("Error", f"Failed to save credentials: {e}")
 
 class GoogleDriveManager(CloudStorageManager):
     """Google Drive integration"""
@@ -65,28 +231,63 @@ class GoogleDriveManager(CloudStorageManager):
     def __init__(self, gui_parent=None):
         super().__init__(gui_parent)
         self.service = None
-        self.folder_id = None
+        self.folder_id = self.credentials.get('google_drive_folder_id')
+        # A remembered folder id is checked against Drive once per session
+        self._folder_verified = False
+        self._file_id_cache = {}
+        self._creds = None
+    
+    def _needs_refresh(self, creds):
+        """Check whether credentials are invalid or close to expiring"""
+        if not creds.valid:
+            return True
+        if creds.expiry is None:
+            return False
+        # google-auth keeps expiry as a naive UTC datetime
+        expiry = creds.expiry
+        if expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=timezone.utc)
+        remaining = (expiry - datetime.now(timezone.utc)).total_seconds()
+        return remaining <= TOKEN_REFRESH_MARGIN
+    
+    def _save_token(self, token_file, creds):
+        """Write the token file, replacing it atomically so an exit mid-write can't truncate it"""
+        tmp_file = token_file.with_suffix('.tmp')
+        try:
+            tmp_file.write_text(creds.to_json())
+            os.replace(tmp_file, token_file)
+        except OSError:
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
         
     def authenticate(self):
         """Authenticate with Google Drive"""
         if not GOOGLE_DRIVE_AVAILABLE:
-            messagebox.showerror("Error", 
-                               "Google Drive integration requires additional packages.\n"
-                               "Please install: pip install google-api-python-client google-auth-oauthlib")
+            self._ui_error("Error", 
+                         "Google Drive integration requires additional packages.\n"
+                         "Please install: pip install google-api-python-client google-auth-oauthlib")
             return False
             
+        # Reuse the in-process credentials while they are still comfortably valid
+        if self.service and self._creds and not self._needs_refresh(self._creds):
+            return True
+            
         try:
-            creds = None
+            creds = self._creds
             token_file = self.credentials_file.parent / "google_token.json"
+            token_changed = False
             
-            # Load existing token
-            if token_file.exists():
+            # Load existing token, touching disk only on first use
+            if creds is None and token_file.exists():
                 creds = Credentials.from_authorized_user_file(str(token_file), self.SCOPES)
             
             # If no valid credentials, get new ones
-            if not creds or not creds.valid:
-                if creds and creds.expired and creds.refresh_token:
+            if not creds or self._needs_refresh(creds):
+                if creds and creds.refresh_token:
                     creds.refresh(Request())
+                    token_changed = True
                 else:
                     # Create OAuth flow
                     client_config = {
@@ -100,30 +301,51 @@ class GoogleDriveManager(CloudStorageManager):
                     }
                     
                     # For now, show instructions to user
-                    messagebox.showinfo("Google Drive Authentication",
-                                      "To enable Google Drive integration:\n\n"
-                                      "1. Go to Google Cloud Console\n"
-                                      "2. Create a new project or select existing\n"
-                                      "3. Enable Google Drive API\n"
-                                      "4. Create OAuth 2.0 credentials\n"
-                                      "5. Download the credentials.json file\n\n"
-                                      "This is a demo version - contact developer for full setup.")
+                    self._ui_info("Google Drive Authentication",
+                                "To enable Google Drive integration:\n\n"
+                                "1. Go to Google Cloud Console\n"
+                                "2. Create a new project or select existing\n"
+                                "3. Enable Google Drive API\n"
+                                "4. Create OAuth 2.0 credentials\n"
+                                "5. Download the credentials.json file\n\n"
+                                "This is a demo version - contact developer for full setup.")
                     return False
             
             # Save the credentials for next run
-            with open(token_file, 'w') as token:
-                token.write(creds.to_json())
-            
-            self.service = build('drive', 'v3', credentials=creds)
-            self._ensure_app_folder()
-            self.credentials['google_drive'] = True
+            if token_changed:
+                self._save_token(token_file, creds)
+            
+            self._creds = creds
+            # One explicit transport, reused across requests
+            http = AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+            self.service = build('drive', 'v3', http=http)
+            # The folder id is remembered across runs to skip the lookup, but it
+            # goes stale if the folder is deleted or another account signs in
+            if self.folder_id and not self._folder_verified and not self._app_folder_exists():
+                self.folder_id = None
+                self._file_id_cache = {}
+            if not self.folder_id:
+                self._ensure_app_folder()
+                self.set_credential('google_drive_folder_id', self.folder_id)
+            self._folder_verified = True
+            self.set_credential('google_drive', True)
             self.save_credentials()
             return True
             
         except Exception as e:
-            messagebox.showerror("Authentication Error", f"Failed to authenticate with Google Drive: {e}")
+            self._ui_error("Authentication Error", f"Failed to authenticate with Google Drive: {e}")
             return False
     
+    def _app_folder_exists(self):
+        """Check that the remembered app folder is still reachable and not trashed"""
+        try:
+            folder = self.service.files().get(fileId=self.folder_id, fields='id,trashed').execute()
+        except HttpError as e:
+            if e.resp.status == 404:
+                return False
+            raise
+        return not folder.get('trashed', False)
+    
     def _ensure_app_folder(self):
         """Ensure app folder exists in Google Drive"""
         try:
@@ -148,25 +370,39 @@ class GoogleDriveManager(CloudStorageManager):
         except Exception as e:
             raise Exception(f"Failed to create app folder: {e}")
     
-    def upload_backup(self, local_file_path, callback=None):
-        """Upload backup to Google Drive"""
+    def _create_file(self, filename, media):
+        """Create a file in the app folder from a media upload"""
+        file_metadata = {
+            'name': filename,
+            'parents': [self.folder_id]
+        }
+        
+        return self.service.files().create(
+            body=file_metadata,
+            media_body=media,
+            fields='id'
+        ).execute()
+    
+    def upload_configuration(self, backup_tool, filename, callback=None):
+        """Create a backup of the current configuration and upload it without a temp file"""
         try:
             if not self.service:
                 raise Exception("Not authenticated with Google Drive")
+            
+            with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, suffix='.zip') as buffer:
+                backup_tool.export_configuration_stream(buffer, UPLOAD_COMPRESSLEVEL)
+                size = buffer.tell()
+                buffer.seek(0)
                 
-            filename = Path(local_file_path).name
-            
-            file_metadata = {
-                'name': filename,
-                'parents': [self.folder_id]
-            }
-            
-            media = MediaFileUpload(local_file_path, resumable=True)
-            file = self.service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id'
-            ).execute()
+                # Small backups go in one request; larger ones use a resumable
+                # session with 8 MB chunks instead of one chunk holding the whole body
+                if size < SIMPLE_UPLOAD_LIMIT:
+                    media = MediaIoBaseUpload(buffer, mimetype='application/zip', resumable=False)
+                else:
+                    media = MediaIoBaseUpload(buffer, mimetype='application/zip',
+                                              chunksize=UPLOAD_CHUNK_SIZE, resumable=True)
+                file = self._create_file(filename, media)
+            self._file_id_cache[filename] = file['id']
             
             if callback:
                 callback(f"Successfully uploaded {filename} to Google Drive")
@@ -183,17 +419,21 @@ class GoogleDriveManager(CloudStorageManager):
             if not self.service:
                 raise Exception("Not authenticated with Google Drive")
                 
-            # Find file
-            results = self.service.files().list(
-                q=f"name='{filename}' and parents in '{self.folder_id}' and trashed=false"
-            ).execute()
-            
-            files = results.get('files', [])
-            
-            if not files:
-                raise Exception(f"File {filename} not found")
+            # Find file, using the id from the last listing when available
+            file_id = self._file_id_cache.get(filename)
+            if file_id is None:
+                results = self.service.files().list(
+                    q=f"name='{filename}' and parents in '{self.folder_id}' and trashed=false"
+                ).execute()
+                
+                files = results.get('files', [])
                 
-            file_id = files[0]['id']
+                if not files:
+                    raise Exception(f"File {filename} not found")
+                    
+                file_id = files[0]['id']
+                self._file_id_cache[filename] = file_id
+            
             request = self.service.files().get_media(fileId=file_id)
             
             with open(local_path, 'wb') as fh:
@@ -222,7 +462,10 @@ class GoogleDriveManager(CloudStorageManager):
                 fields="files(id,name,modifiedTime,size)"
             ).execute()
             
-            return results.get('files', [])
+            files = results.get('files', [])
+            # Reversed so the first match for a name wins, as in the name query
+            self._file_id_cache = {f['name']: f['id'] for f in reversed(files)}
+            return files
             
         except Exception:
             return []
@@ -230,30 +473,42 @@ class GoogleDriveManager(CloudStorageManager):
 class iCloudManager(CloudStorageManager):
     """iCloud Drive integration using local folder access"""
     
+    # iCloud Drive folder found by an earlier probe, shared by all instances
+    _detected_icloud_path = None
+    
     def __init__(self, gui_parent=None):
         super().__init__(gui_parent)
         self.icloud_path = None
         self.app_folder_path = None
-        
-    def authenticate(self):
-        """Set up iCloud Drive access"""
-        try:
-            # Find iCloud Drive path
+    
+    @classmethod
+    def _find_icloud_path(cls):
+        """Locate the iCloud Drive folder, remembering it once found"""
+        if cls._detected_icloud_path is None:
+            home = os.environ.get('HOME') or str(Path.home())
             possible_paths = [
-                Path.home() / "Library" / "Mobile Documents" / "com~apple~CloudDocs",
-                Path.home() / "iCloud Drive (Archive)" / "iCloud Drive",
-                Path.home() / "iCloud Drive"
+                os.path.join(home, "Library", "Mobile Documents", "com~apple~CloudDocs"),
+                os.path.join(home, "iCloud Drive (Archive)", "iCloud Drive"),
+                os.path.join(home, "iCloud Drive"),
             ]
             
             for path in possible_paths:
-                if path.exists() and path.is_dir():
-                    self.icloud_path = path
+                if os.path.isdir(path):
+                    cls._detected_icloud_path = Path(path)
                     break
+        
+        return cls._detected_icloud_path
+        
+    def authenticate(self):
+        """Set up iCloud Drive access"""
+        try:
+            # Find iCloud Drive path
+            self.icloud_path = self._find_icloud_path()
             
             if not self.icloud_path:
-                messagebox.showerror("iCloud Not Found", 
-                                   "iCloud Drive folder not found.\n"
-                                   "Please ensure iCloud Drive is enabled in System Preferences.")
+                self._ui_error("iCloud Not Found", 
+                             "iCloud Drive folder not found.\n"
+                             "Please ensure iCloud Drive is enabled in System Preferences.")
                 return False
             
             # Create app folder
@@ -266,35 +521,41 @@ class iCloudManager(CloudStorageManager):
                 test_file.write_text("test")
                 test_file.unlink()
             except Exception:
-                messagebox.showerror("Permission Error", 
-                                   "Cannot write to iCloud Drive folder.\n"
-                                   "Please check permissions.")
+                self._ui_error("Permission Error", 
+                             "Cannot write to iCloud Drive folder.\n"
+                             "Please check permissions.")
                 return False
             
-            self.credentials['icloud'] = True
+            self.set_credential('icloud', True)
             self.save_credentials()
             return True
             
         except Exception as e:
-            messagebox.showerror("iCloud Setup Error", f"Failed to set up iCloud integration: {e}")
+            self._ui_error("iCloud Setup Error", f"Failed to set up iCloud integration: {e}")
             return False
     
-    def upload_backup(self, local_file_path, callback=None):
-        """Upload backup to iCloud Drive"""
+    def upload_configuration(self, backup_tool, filename, callback=None):
+        """Create a backup of the current configuration directly in iCloud Drive"""
+        dest_path = None
         try:
             if not self.app_folder_path:
                 raise Exception("iCloud Drive not set up")
-                
-            filename = Path(local_file_path).name
-            dest_path = self.app_folder_path / filename
             
-            shutil.copy2(local_file_path, dest_path)
+            dest_path = self.app_folder_path / filename
+            with open(dest_path, 'w+b') as dest:
+                backup_tool.export_configuration_stream(dest, UPLOAD_COMPRESSLEVEL)
             
             if callback:
                 callback(f"Successfully copied {filename} to iCloud Drive")
             return True
             
         except Exception as e:
+            # Don't leave a partial backup in the synced folder
+            if dest_path is not None:
+                try:
+                    dest_path.unlink()
+                except OSError:
+                    pass
             if callback:
                 callback(f"Upload failed: {e}")
             return False
@@ -310,7 +571,7 @@ class iCloudManager(CloudStorageManager):
             if not source_path.exists():
                 raise Exception(f"File {filename} not found in iCloud Drive")
                 
-            shutil.copy2(source_path, local_path)
+            _stream_copy(source_path, local_path)
             
             if callback:
                 callback(f"Successfully downloaded {filename}")
@@ -327,16 +588,19 @@ class iCloudManager(CloudStorageManager):
             if not self.app_folder_path or not self.app_folder_path.exists():
                 return []
                 
+            with os.scandir(self.app_folder_path) as it:
+                entries = [e for e in it if e.name.endswith('.zip') and e.is_file()]
+            
             backups = []
-            for file_path in self.app_folder_path.glob("*.zip"):
-                stat = file_path.stat()
+            for entry in entries:
+                stat = entry.stat()
                 backups.append({
-                    'name': file_path.name,
+                    'name': entry.name,
                     'modifiedTime': datetime.fromtimestamp(stat.st_mtime).isoformat(),
                     'size': str(stat.st_size)
                 })
                 
-            return sorted(backups, key=lambda x: x['modifiedTime'], reverse=True)
+            return sorted(backups, key=itemgetter('modifiedTime'), reverse=True)
             
         except Exception:
             return []
@@ -349,6 +613,8 @@ class CloudStorageDialog:
         self.result = None
         self.google_manager = GoogleDriveManager(parent)
         self.icloud_manager = iCloudManager(parent)
+        self._log_second = None
+        self._log_clock = ""
         
     def show_auth_dialog(self):
         """Show authentication dialog"""
@@ -508,6 +774,8 @@ class CloudStorageDialog:
                  command=dialog.destroy).pack(side=tk.RIGHT)
         
         self.sync_dialog = dialog
+        self._log_buf = collections.deque()
+        self._flush_sync_log(self.sync_progress, self._log_buf)
     
     def _sync_operation(self, operation):
         """Perform upload or download operation"""
@@ -515,26 +783,20 @@ class CloudStorageDialog:
         manager = self.google_manager if service == 'google' else self.icloud_manager
         
         def log_message(message):
-            self.sync_dialog.after(0, lambda: self._log_sync_message(message))
+            # Buffered and written to the widget by the periodic flush
+            self._log_sync_message(message)
         
         def sync_thread():
             try:
                 if operation == 'upload':
                     # Get current configuration backup
                     from orca_backup import OrcaBackup
-                    backup_tool = OrcaBackup()
+                    backup_tool = OrcaBackup.shared()
                     
-                    with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp:
-                        filename = f"orcaslicer_config_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
-                        backup_file = Path(tmp.name).parent / filename
-                        
-                        log_message("Creating configuration backup...")
-                        backup_tool.export_configuration(str(backup_file))
-                        
-                        log_message(f"Uploading to {service.title()} Drive...")
-                        manager.upload_backup(str(backup_file), log_message)
-                        
-                        backup_file.unlink()  # Cleanup
+                    filename = f"orcaslicer_config_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+                    
+                    log_message(f"Creating configuration backup and uploading to {service.title()} Drive...")
+                    manager.upload_configuration(backup_tool, filename, log_message)
                         
                 else:
                     # Download operation
@@ -566,6 +828,31 @@ class CloudStorageDialog:
         threading.Thread(target=sync_thread, daemon=True).start()
     
     def _log_sync_message(self, message):
-        """Add message to sync progress log"""
-        self.sync_progress.insert(tk.END, f"{datetime.now().strftime('%H:%M:%S')} - {message}\n")
-        self.sync_progress.see(tk.END)
\ No newline at end of file
+        """Queue a message for the sync progress log (safe to call from worker threads)"""
+        # Only reformat the clock when the second changes
+        second = int(time.time())
+        if second != self._log_second:
+            self._log_clock = time.strftime('%H:%M:%S', time.localtime(second))
+            self._log_second = second
+        self._log_buf.append(f"{self._log_clock} - {message}\n")
+    
+    def _flush_sync_log(self, log_widget, log_buf):
+        """
+        Write queued log messages to a sync progress log in one insert
+        
+        Args:
+            log_widget (tk.Text): Log of the dialog that started this loop; the
+                loop ends once that widget is destroyed, even if a new dialog opened
+            log_buf (collections.deque): Message queue created with that dialog
+        """
+        if not log_widget.winfo_exists():
+            return
+        
+        if log_buf:
+            lines = []
+            while log_buf:
+                lines.append(log_buf.popleft())
+            log_widget.insert(tk.END, "".join(lines))
+            log_widget.see(tk.END)
+        
+        log_widget.after(LOG_FLUSH_INTERVAL_MS, self._flush_sync_log, log_widget, log_buf)
\ No newline at end of file
@@ -6,146 +6,381 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
 import os
-import tempfile
+import time
 import zipfile
+import zlib
+import itertools
+import contextlib
+from collections import OrderedDict
 from pathlib import Path
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from orca_backup import OrcaBackup
-from utils import format_file_size, OrcaSlicerProcessDetector
+from utils import format_file_size, iter_files, OrcaSlicerProcessDetector
 from cloud_storage import CloudStorageDialog
 
+# Per-thread buffer that current files are read into for checksumming
+CRC_BUFFER_SIZE = 256 * 1024
+
+# Same-size files at least QUICK_CHECK_MIN_SIZE bytes first compare their leading bytes
+QUICK_CHECK_SIZE = 4096
+QUICK_CHECK_MIN_SIZE = 1024 * 1024
+
+# Number of backups whose parsed file lists are remembered
+ENTRIES_CACHE_SIZE = 4
+
+# Report compare progress after this many content checks
+PROGRESS_INTERVAL = 25
+
+# Worker threads for comparing file contents; the work is mostly waiting on I/O
+COMPARE_MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
 class ConfigDiff:
     """Compare two OrcaSlicer configurations"""
     
     def __init__(self, backup_tool):
         self.backup_tool = backup_tool
+        # Current-file CRCs: (mtime_ns, ctime_ns, size, crc), reused across compares.
+        # Keyed by (device, inode) where available so hardlinked files are read once
+        self._crc_cache = {}
+        # Per-thread read buffer reused for every checksum
+        self._local = threading.local()
+        # Parsed backup file lists by (path, mtime_ns, size), most recent last
+        self._entries_cache = OrderedDict()
+    
+    def _file_crc32(self, path):
+        """
+        Compute the CRC32 of a file, reading it in blocks
+        
+        Files are read rather than memory-mapped: OrcaSlicer may rewrite them while
+        a read-only compare runs, and a truncated mapping kills the process.
+        
+        Args:
+            path (str): File to checksum
+            
+        Returns:
+            int: CRC32 in the same form zipfile stores it
+        """
+        buf = getattr(self._local, 'buf', None)
+        if buf is None:
+            buf = self._local.buf = memoryview(bytearray(CRC_BUFFER_SIZE))
+        
+        crc = 0
+        # Unbuffered, since the blocks are already large
+        with open(path, 'rb', buffering=0) as f:
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    return crc
+                crc = zlib.crc32(buf[:n], crc)
+    
+    def _crc_key(self, path, st):
+        """Identify a file for the CRC cache; st_ino is 0 where it isn't known (Windows scans)"""
+        return (st.st_dev, st.st_ino) if st.st_ino else path
+    
+    def _cached_crc32(self, path, st):
+        """Get a remembered CRC32 for a file, or None if it changed or was never read"""
+        cached = self._crc_cache.get(self._crc_key(path, st))
+        # ctime also moves when a copy or restore puts the old mtime back
+        if cached and cached[:3] == (st.st_mtime_ns, st.st_ctime_ns, st.st_size):
+            return cached[3]
+        return None
+    
+    def _current_crc32(self, path, st):
+        """
+        Get the CRC32 of a current file, reusing it while its mtime, ctime and size are unchanged
+        
+        Args:
+            path (str): Current file
+            st (os.stat_result): Its stat result
+            
+        Returns:
+            int: CRC32 of the file contents
+        """
+        crc = self._cached_crc32(path, st)
+        if crc is not None:
+            return crc
+        
+        crc = self._file_crc32(path)
+        self._crc_cache[self._crc_key(path, st)] = (st.st_mtime_ns, st.st_ctime_ns, st.st_size, crc)
+        return crc
+    
+    def _heads_differ(self, zipf, member, path):
+        """
+        Compare the first QUICK_CHECK_SIZE bytes of a current file and its backup member
+        
+        Args:
+            zipf (zipfile.ZipFile): Open backup archive
+            member (zipfile.ZipInfo): Backup member
+            path (str): Current file
+            
+        Returns:
+            bool: True if the leading bytes differ
+        """
+        with open(path, 'rb') as current, zipf.open(member) as backup:
+            return current.read(QUICK_CHECK_SIZE) != backup.read(QUICK_CHECK_SIZE)
+    
+    def _diff_content(self, zipf, rel_path, current_path, st, member):
+        """
+        Check one same-size current file against its backup member's CRC
+        
+        Args:
+            zipf (zipfile.ZipFile): Open backup archive, or None to skip the head check
+            rel_path (str): Path relative to the configuration directory
+            current_path (str): Current file
+            st (os.stat_result): Stat result of the current file from the scan
+            member (zipfile.ZipInfo): Backup member
+            
+        Returns:
+            dict: Difference details, or None if the files match or can't be read
+        """
+        try:
+            # For a large file with no remembered CRC, edits near the top are
+            # caught by inflating one block instead of reading the whole file
+            if (zipf is not None
+                    and st.st_size >= QUICK_CHECK_MIN_SIZE
+                    and self._cached_crc32(current_path, st) is None
+                    and self._heads_differ(zipf, member, current_path)):
+                changed = True
+            else:
+                changed = self._current_crc32(current_path, st) != member.CRC
+            
+            if changed:
+                return {
+                    'file': rel_path,
+                    'current_size': st.st_size,
+                    'backup_size': member.file_size,
+                    'reason': 'Different content'
+                }
+        except Exception:
+            pass
+        
+        return None
+    
+    def _backup_entries(self, backup_file, st):
+        """
+        Get the config members of a backup, reusing a recent parse of the same file
+        
+        Args:
+            backup_file (str): Path to backup zip file
+            st (os.stat_result): Its stat result
+            
+        Returns:
+            dict: Path relative to config/ to ZipInfo, or None if it isn't a backup
+        """
+        key = (os.path.abspath(backup_file), st.st_mtime_ns, st.st_size)
+        if key in self._entries_cache:
+            self._entries_cache.move_to_end(key)
+            return self._entries_cache[key]
+        
+        # Read the backup side straight from the zip central directory
+        with zipfile.ZipFile(backup_file, 'r') as zipf:
+            members = zipf.infolist()
+        
+        entries = {
+            member.filename[len('config/'):]: member
+            for member in members
+            if member.filename.startswith('config/') and not member.is_dir()
+        }
+        
+        # An empty config/ directory entry still counts as a valid backup
+        if not entries and not any(m.filename.startswith('config/') for m in members):
+            return None
+        
+        self._entries_cache[key] = entries
+        if len(self._entries_cache) > ENTRIES_CACHE_SIZE:
+            self._entries_cache.popitem(last=False)
+        return entries
     
-    def compare_with_backup(self, backup_file):
+    def compare_with_backup(self, backup_file, progress_cb=None, cancel_event=None):
         """
         Compare current configuration with a backup file
         
         Args:
             backup_file (str): Path to backup zip file
+            progress_cb (callable): Called as progress_cb(done, total) while contents are checked
+            cancel_event (threading.Event): Stops the comparison early once set
             
         Returns:
-            dict: Comparison results
+            dict: Comparison results, or {'cancelled': True} if cancelled
         """
         current_info = self.backup_tool.get_config_info()
         
         if not current_info['config_found']:
             return {'error': 'No current configuration found'}
         
-        # Extract backup to temp directory for comparison
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                
-                with zipfile.ZipFile(backup_file, 'r') as zipf:
-                    zipf.extractall(temp_path)
-                
-                config_backup = temp_path / "config"
-                if not config_backup.exists():
-                    return {'error': 'Invalid backup file'}
-                
-                current_config = Path(current_info['config_path'])
-                
-                # Compare directory structures
-                comparison = {
-                    'current_files': set(),
-                    'backup_files': set(),
-                    'common_files': set(),
-                    'different_files': [],
-                    'only_in_current': set(),
-                    'only_in_backup': set()
-                }
-                
-                # Get all files in current config
-                if current_config.exists():
-                    for file_path in current_config.rglob('*'):
-                        if file_path.is_file():
-                            rel_path = file_path.relative_to(current_config)
-                            comparison['current_files'].add(str(rel_path))
-                
-                # Get all files in backup config
-                for file_path in config_backup.rglob('*'):
-                    if file_path.is_file():
-                        rel_path = file_path.relative_to(config_backup)
-                        comparison['backup_files'].add(str(rel_path))
-                
-                # Find common files and differences
-                comparison['common_files'] = comparison['current_files'] & comparison['backup_files']
-                comparison['only_in_current'] = comparison['current_files'] - comparison['backup_files']
-                comparison['only_in_backup'] = comparison['backup_files'] - comparison['current_files']
-                
-                # Check for file content differences
-                for rel_path in comparison['common_files']:
-                    current_file = current_config / rel_path
-                    backup_file = config_backup / rel_path
-                    
+            backup_stat = os.stat(backup_file)
+            backup_entries = self._backup_entries(backup_file, backup_stat)
+            if backup_entries is None:
+                return {'error': 'Invalid backup file'}
+            
+            current_config = Path(current_info['config_path'])
+            
+            # Compare directory structures
+            comparison = {
+                'current_files': {},
+                'backup_files': {},
+                'common_files': set(),
+                'different_files': [],
+                'only_in_current': set(),
+                'only_in_backup': set()
+            }
+            
+            # Stat every current file once during the walk; sizes are keyed by relative path
+            current_stats = {}
+            if current_config.exists():
+                for rel_path, entry in iter_files(current_config):
+                    if cancel_event is not None and cancel_event.is_set():
+                        return {'cancelled': True}
                     try:
-                        current_size = current_file.stat().st_size
-                        backup_size = backup_file.stat().st_size
-                        
-                        if current_size != backup_size:
-                            comparison['different_files'].append({
-                                'file': rel_path,
-                                'current_size': current_size,
-                                'backup_size': backup_size,
-                                'reason': 'Different file sizes'
-                            })
-                        else:
-                            # For small files, compare content
-                            if current_size < 1024 * 1024:  # Less than 1MB
-                                try:
-                                    with open(current_file, 'rb') as f1, open(backup_file, 'rb') as f2:
-                                        if f1.read() != f2.read():
-                                            comparison['different_files'].append({
-                                                'file': rel_path,
-                                                'current_size': current_size,
-                                                'backup_size': backup_size,
-                                                'reason': 'Different content'
-                                            })
-                                except Exception:
-                                    pass
-                    except Exception:
+                        current_stats[rel_path] = (entry.path, entry.stat())
+                    except OSError:
+                        # Removed while walking
                         pass
+            
+            current_files = {rel: st.st_size for rel, (_, st) in current_stats.items()}
+            backup_files = {rel: member.file_size for rel, member in backup_entries.items()}
+            comparison['current_files'] = current_files
+            comparison['backup_files'] = backup_files
+            
+            # Bucket every current file in one pass; size differences are settled
+            # from metadata alone, same-size files by CRC (cached ones aren't reread)
+            common_files = comparison['common_files']
+            only_in_current = comparison['only_in_current']
+            to_check = []
+            for rel_path, current_size in current_files.items():
+                backup_size = backup_files.get(rel_path)
+                if backup_size is None:
+                    only_in_current.add(rel_path)
+                    continue
                 
-                return comparison
-                
+                common_files.add(rel_path)
+                if current_size != backup_size:
+                    comparison['different_files'].append({
+                        'file': rel_path,
+                        'current_size': current_size,
+                        'backup_size': backup_size,
+                        'reason': 'Different file sizes'
+                    })
+                else:
+                    to_check.append(rel_path)
+            
+            comparison['only_in_backup'] = backup_files.keys() - common_files
+            
+            # Check for file content differences; each pair is independent
+            if to_check:
+                # The archive is only opened when a large file's head will be compared
+                needs_zip = any(current_files[p] >= QUICK_CHECK_MIN_SIZE for p in to_check)
+                with (zipfile.ZipFile(backup_file, 'r') if needs_zip else contextlib.nullcontext()) as zipf:
+                    with ThreadPoolExecutor(max_workers=COMPARE_MAX_WORKERS) as pool:
+                        diffs = pool.map(self._diff_content, itertools.repeat(zipf), to_check,
+                                         [current_stats[p][0] for p in to_check],
+                                         [current_stats[p][1] for p in to_check],
+                                         [backup_entries[p] for p in to_check])
+                        
+                        total = len(to_check)
+                        for done, diff in enumerate(diffs, start=1):
+                            if diff is not None:
+                                comparison['different_files'].append(diff)
+                            
+                            if cancel_event is not None and cancel_event.is_set():
+                                # Drop queued checks; the few already running finish on exit
+                                pool.shutdown(wait=False, cancel_futures=True)
+                                return {'cancelled': True}
+                            
+                            if progress_cb is not None and (done % PROGRESS_INTERVAL == 0 or done == total):
+                                progress_cb(done, total)
+            
+            return comparison
+            
         except Exception as e:
             return {'error': f'Failed to compare configurations: {e}'}
 
+# Status rows in display order: (iid, label)
+STATUS_ROWS = [
+    ('mode', "Mode"),
+    ('installation_found', "Installation found"),
+    ('installation_path', "Installation path"),
+    ('config_found', "Configuration found"),
+    ('config_path', "Configuration path"),
+    ('config_size', "Configuration size"),
+    ('file_count', "Number of files"),
+    ('error', "Status"),
+]
+
+# Progress spinner frames and how often they advance
+SPINNER_FRAMES = "|/-\\"
+SPINNER_INTERVAL_MS = 200
+
+# Initial main window size
+WINDOW_WIDTH = 700
+WINDOW_HEIGHT = 600
+
+# Background poll: one process probe and one cloud refresh at most per tick
+POLL_INTERVAL_MS = 1000
+# How long the OrcaSlicer warning keeps probing before giving up
+SHUTDOWN_WAIT_SECONDS = 20
+
+# Fixed status row texts, built once rather than on every refresh
+_YES_NO = {True: "Yes", False: "No"}
+_READ_ONLY_NOTICE = "⚠️ READ-ONLY - OrcaSlicer is running, only backup/compare available"
+_NOT_FOUND_NOTICE = ("OrcaSlicer configuration not found. Please ensure "
+                     "OrcaSlicer is installed and run at least once.")
+
 class OrcaBackupGUI:
     """Simple GUI for OrcaSlicer backup operations"""
     
     def __init__(self):
-        self.backup_tool = OrcaBackup()
+        self.backup_tool = OrcaBackup.shared()
         self.diff_tool = ConfigDiff(self.backup_tool)
         self.cloud_dialog = None
         self.process_detector = OrcaSlicerProcessDetector()
         self.read_only_mode = False
+        self._info_cache = None
+        self._pending_refresh = None
+        self._status_generation = 0
+        self._last_status_rows = {}
+        self._last_results = None
+        self._shutting_down = False
+        self._busy = False
+        self._spinner_after = None
+        self._spinner_step = 0
+        # Latest (done, total) from a running compare, read by the spinner
+        self._progress = None
+        self._compare_cancel = None
+        # Save/load/compare jobs run one at a time on a reused worker thread
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='orca-io')
+        # Shared poll job; callers set flags and _poll_tick acts on them
+        self._poll_job = None
+        self._cloud_status_dirty = False
+        self._shutdown_wait = None
+        self._probe_pending = False
+        # Status scans and process probes share a second reused worker thread
+        self._bg_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='orca-bg')
         self.root = tk.Tk()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self.setup_window()
         self.create_widgets()
         self.check_orcaslicer_running()
-        self.update_status()
     
     def setup_window(self):
         """Setup main window properties"""
         self.root.title("OrcaSlicer Configuration Manager")
-        self.root.geometry("700x600")
         self.root.resizable(True, True)
         
-        # Center window on screen
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        # Center window on screen; the size is known, so no layout pass is needed
+        width, height = WINDOW_WIDTH, WINDOW_HEIGHT
+        x = (self.root.winfo_screenwidth() - width) // 2
+        y = (self.root.winfo_screenheight() - height) // 2
         self.root.geometry(f'{width}x{height}+{x}+{y}')
     
     def create_widgets(self):
-        """Create all GUI widgets"""
+        """Create all GUI widgets, filling in the action sections once the window is up"""
+        self._create_skeleton()
+        self.root.after_idle(self._create_action_sections)
+    
+    def _create_skeleton(self):
+        """Create the title, status, progress and results sections"""
         # Main container
         main_frame = ttk.Frame(self.root, padding="15")
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -159,8 +394,61 @@ class OrcaBackupGUI:
         status_frame = ttk.LabelFrame(main_frame, text="Configuration Status", padding="10")
         status_frame.pack(fill=tk.X, pady=(0, 15))
         
-        self.status_text = scrolledtext.ScrolledText(status_frame, height=5, width=80)
-        self.status_text.pack(fill=tk.X)
+        self.status_tree = ttk.Treeview(status_frame, columns=('value',), show='tree',
+                                        height=len(STATUS_ROWS))
+        self.status_tree.column('#0', width=160, stretch=False)
+        self.status_tree.column('value', width=480, stretch=True)
+        for iid, label in STATUS_ROWS:
+            self.status_tree.insert('', tk.END, iid=iid, text=label, values=('',))
+            self.status_tree.detach(iid)
+        self.status_tree.pack(fill=tk.X)
+        
+        self.status_var = tk.StringVar(value="")
+        status_label = ttk.Label(status_frame, textvariable=self.status_var,
+                                font=('Arial', 9), foreground='gray')
+        status_label.pack(anchor=tk.W, pady=(5, 0))
+        
+        # Placeholder that keeps the action sections in place until they are built
+        self._actions_frame = ttk.Frame(main_frame)
+        self._actions_frame.pack(fill=tk.X)
+        self._actions_created = False
+        self.cloud_status_var = tk.StringVar(value="Not connected to cloud storage")
+        
+        # Progress section
+        progress_frame = ttk.LabelFrame(main_frame, text="Progress", padding="10")
+        progress_frame.pack(fill=tk.X, pady=(0, 15))
+        
+        self.progress_var = tk.StringVar(value="Ready")
+        progress_label = ttk.Label(progress_frame, textvariable=self.progress_var)
+        progress_label.pack(anchor=tk.W)
+        
+        # Text spinner animated with after() only while a job is running
+        self._spinner_var = tk.StringVar(value="")
+        spinner_row = ttk.Frame(progress_frame)
+        spinner_row.pack(fill=tk.X, pady=(5, 0))
+        spinner_label = ttk.Label(spinner_row, textvariable=self._spinner_var)
+        spinner_label.pack(side=tk.LEFT)
+        
+        self.cancel_btn = ttk.Button(spinner_row, text="Cancel", state='disabled',
+                                    command=self.cancel_compare)
+        self.cancel_btn.pack(side=tk.RIGHT)
+        
+        # Results/Diff section
+        results_frame = ttk.LabelFrame(main_frame, text="Comparison Results", padding="10")
+        results_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Read-only and without an undo stack; it is only ever replaced wholesale
+        self.results_text = scrolledtext.ScrolledText(results_frame, height=12, width=80,
+                                                      undo=False, autoseparators=False,
+                                                      state='disabled')
+        self.results_text.pack(fill=tk.BOTH, expand=True)
+    
+    def _create_action_sections(self):
+        """Create the local action buttons and cloud storage section"""
+        if self._actions_created:
+            return
+        self._actions_created = True
+        main_frame = self._actions_frame
         
         # Main action buttons
         button_frame = ttk.Frame(main_frame)
@@ -181,9 +469,9 @@ class OrcaBackupGUI:
         self.load_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         # Compare button
-        compare_btn = ttk.Button(local_frame, text="Compare with Backup", 
-                                command=self.compare_configurations)
-        compare_btn.pack(side=tk.LEFT)
+        self.compare_btn = ttk.Button(local_frame, text="Compare with Backup", 
+                                     command=self.compare_configurations)
+        self.compare_btn.pack(side=tk.LEFT)
         
         # Cloud storage section
         cloud_frame = ttk.LabelFrame(main_frame, text="Cloud Storage", padding="10")
@@ -208,74 +496,305 @@ class OrcaBackupGUI:
         download_btn.pack(side=tk.LEFT)
         
         # Cloud status
-        self.cloud_status_var = tk.StringVar(value="Not connected to cloud storage")
         cloud_status_label = ttk.Label(cloud_frame, textvariable=self.cloud_status_var,
                                       font=('Arial', 9), foreground='gray')
         cloud_status_label.pack(pady=(5, 0))
+    
+    def _on_close(self):
+        """Stop delivering worker results and close the window"""
+        self._shutting_down = True
+        # Queued jobs are dropped; a job already running is left to finish
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._bg_pool.shutdown(wait=False, cancel_futures=True)
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+            self._poll_job = None
+        self.root.destroy()
+    
+    def _post(self, callback):
+        """
+        Run callback on the Tk main thread; does nothing once the window is closing
         
-        # Progress section
-        progress_frame = ttk.LabelFrame(main_frame, text="Progress", padding="10")
-        progress_frame.pack(fill=tk.X, pady=(0, 15))
+        Args:
+            callback (callable): Function to call with no arguments
+        """
+        if self._shutting_down:
+            return
+        try:
+            self.root.after(0, callback)
+        except (RuntimeError, tk.TclError):
+            # The window was destroyed between the check and the call
+            pass
+    
+    def _request_poll(self, delay_ms=POLL_INTERVAL_MS):
+        """Make sure the poll job is scheduled, without queuing a second one"""
+        if self._poll_job is None and not self._shutting_down:
+            self._poll_job = self.root.after(delay_ms, self._poll_tick)
+    
+    def _poll_tick(self):
+        """Handle pending cloud refreshes and OrcaSlicer probes in one pass"""
+        self._poll_job = None
+        
+        if self._cloud_status_dirty:
+            self._cloud_status_dirty = False
+            self.update_cloud_status()
+        
+        wait = self._shutdown_wait
+        if wait is not None and not wait['window'].winfo_exists():
+            # The warning was closed from the title bar
+            self._shutdown_wait = wait = None
+        
+        if wait is not None and (wait['manual'] or not wait['timed_out']):
+            if wait['watching'] and not wait['manual']:
+                # The exit watcher wakes the job when OrcaSlicer goes away
+                return
+            if not self._probe_pending:
+                self._probe_pending = True
+                self._bg_pool.submit(self._probe_orcaslicer)
+            # Keep ticking while the warning is still waiting automatically
+            if not wait['timed_out']:
+                self._request_poll()
+    
+    def _watch_orcaslicer_exit(self, wait):
+        """Block until the running OrcaSlicer exits or the wait runs out (watcher thread)"""
+        try:
+            pid = self.process_detector.find_orcaslicer_pid()
+            if pid is not None:
+                self.process_detector.wait_for_exit(pid, SHUTDOWN_WAIT_SECONDS)
+        except Exception:
+            pass
+        self._post(lambda: self._on_watch_finished(wait))
+    
+    def _on_watch_finished(self, wait):
+        """Fall back to probing once the exit watcher returns, confirming the exit"""
+        if self._shutdown_wait is not wait:
+            return
+        wait['watching'] = False
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+            self._poll_job = None
+        self._request_poll(0)
+    
+    def _probe_orcaslicer(self):
+        """Run one process probe on the background worker and hand the result back"""
+        try:
+            running = self.process_detector.is_orcaslicer_running()
+        except Exception:
+            running = True
+        self._post(lambda: self._on_probe_result(running))
+    
+    def _on_probe_result(self, running):
+        """Act on a process probe while the OrcaSlicer warning is open"""
+        self._probe_pending = False
+        wait = self._shutdown_wait
+        if wait is None or not wait['window'].winfo_exists():
+            self._shutdown_wait = None
+            return
         
-        self.progress_var = tk.StringVar(value="Ready")
-        progress_label = ttk.Label(progress_frame, textvariable=self.progress_var)
-        progress_label.pack(anchor=tk.W)
+        manual = wait['manual']
+        wait['manual'] = False
+        elapsed = time.monotonic() - wait['started']
         
-        self.progress_bar = ttk.Progressbar(progress_frame, mode='indeterminate')
-        self.progress_bar.pack(fill=tk.X, pady=(5, 0))
+        if not running:
+            # OrcaSlicer shut down successfully
+            self._shutdown_wait = None
+            wait['window'].destroy()
+            if manual:
+                messagebox.showinfo("Ready", "OrcaSlicer has been closed. Ready to proceed!")
+            else:
+                messagebox.showinfo("Ready", 
+                                  f"OrcaSlicer has been closed. Ready to proceed!\n"
+                                  f"Shutdown detected after {elapsed:.1f} seconds.")
+        elif manual:
+            messagebox.showinfo("Still Running", 
+                               "OrcaSlicer is still running. Please close it to continue with full functionality.",
+                               parent=wait['window'])
+        elif not wait['timed_out'] and elapsed >= SHUTDOWN_WAIT_SECONDS:
+            # Timeout reached; from now on only "Check Again" probes
+            wait['timed_out'] = True
+            wait['progress_bar'].stop()
+            wait['progress_var'].set(f"OrcaSlicer still running after {SHUTDOWN_WAIT_SECONDS} seconds")
+            messagebox.showwarning("Still Running", 
+                                 f"OrcaSlicer is still running after {SHUTDOWN_WAIT_SECONDS} seconds of waiting.\n"
+                                 "You can continue in backup/read-only mode or manually close OrcaSlicer.",
+                                 parent=wait['window'])
+    
+    def get_config_info(self, max_age=5.0):
+        """
+        Get configuration info, reusing a recent scan of the same, unchanged paths
         
-        # Results/Diff section
-        results_frame = ttk.LabelFrame(main_frame, text="Comparison Results", padding="10")
-        results_frame.pack(fill=tk.BOTH, expand=True)
+        Args:
+            max_age (float): Seconds a cached scan stays valid
+            
+        Returns:
+            dict: Configuration information
+        """
+        paths = self.backup_tool.detect_installation()
+        now = time.monotonic()
         
-        self.results_text = scrolledtext.ScrolledText(results_frame, height=12, width=80)
-        self.results_text.pack(fill=tk.BOTH, expand=True)
+        # A top-level change (file added, removed or renamed) invalidates the scan early
+        config_path = paths[1]
+        try:
+            config_mtime = os.stat(config_path).st_mtime_ns if config_path else None
+        except OSError:
+            config_mtime = None
+        key = (paths, config_mtime)
+        
+        if self._info_cache is not None:
+            cached_at, cached_key, info = self._info_cache
+            if cached_key == key and now - cached_at < max_age:
+                return info
+        
+        info = self.backup_tool.get_config_info()
+        self._info_cache = (now, key, info)
+        return info
+    
+    def schedule_refresh(self, delay_ms=250):
+        """Request a status update, coalescing requests made within delay_ms"""
+        if self._pending_refresh is not None:
+            self.root.after_cancel(self._pending_refresh)
+        self._pending_refresh = self.root.after(delay_ms, self._do_update_status)
+    
+    def _do_update_status(self):
+        """Run a scheduled status update"""
+        self._pending_refresh = None
+        self.update_status()
     
     def update_status(self):
-        """Update configuration status display"""
-        try:
-            info = self.backup_tool.get_config_info()
+        """Update configuration status display, scanning on the background worker"""
+        self._status_generation += 1
+        generation = self._status_generation
+        
+        # The rows keep their last values until the scan finishes
+        self.status_var.set("Scanning configuration, please wait...")
+        
+        def status_thread():
+            rows = self._compute_status_rows()
             
-            status = "OrcaSlicer Configuration Status\n"
-            status += "=" * 50 + "\n"
+            # Update UI in main thread
+            self._post(lambda: self._apply_status_rows(rows, generation))
+        
+        self._bg_pool.submit(status_thread)
+    
+    def _compute_status_rows(self):
+        """
+        Build the status row values (safe to run off the main thread)
+        
+        Returns:
+            dict: Row iid to display value; rows left out are hidden
+        """
+        try:
+            info = self.get_config_info()
+            rows = {}
             
-            # Add read-only mode warning if applicable
             if self.read_only_mode:
-                status += "⚠️ READ-ONLY MODE ACTIVE\n"
-                status += "OrcaSlicer is running - only backup/compare functions available\n\n"
-            
-            status += f"Installation found: {'Yes' if info['installation_found'] else 'No'}\n"
+                rows['mode'] = _READ_ONLY_NOTICE
             
+            rows['installation_found'] = _YES_NO[bool(info['installation_found'])]
             if info['installation_path']:
-                status += f"Installation path: {info['installation_path']}\n"
-            
-            status += f"Configuration found: {'Yes' if info['config_found'] else 'No'}\n"
+                rows['installation_path'] = str(info['installation_path'])
             
+            rows['config_found'] = _YES_NO[bool(info['config_found'])]
             if info['config_path']:
-                status += f"Configuration path: {info['config_path']}\n"
+                rows['config_path'] = str(info['config_path'])
                 if info['config_found']:
-                    status += f"Configuration size: {format_file_size(info['config_size'])}\n"
-                    status += f"Number of files: {info['file_count']}\n"
+                    rows['config_size'] = format_file_size(info['config_size'])
+                    rows['file_count'] = str(info['file_count'])
             
             if not info['config_found']:
-                status += "\nWARNING: OrcaSlicer configuration not found.\n"
-                status += "Please ensure OrcaSlicer is installed and run at least once.\n"
+                rows['error'] = _NOT_FOUND_NOTICE
             
-            self.status_text.delete(1.0, tk.END)
-            self.status_text.insert(tk.END, status)
+            return rows
             
         except Exception as e:
-            self.status_text.delete(1.0, tk.END)
-            self.status_text.insert(tk.END, f"Error updating status: {e}")
+            return {'error': f"Error updating status: {e}"}
+    
+    def _apply_status_rows(self, rows, generation):
+        """Show status rows from a scan, unless a newer scan has started"""
+        if generation != self._status_generation:
+            return
+        
+        self._render_status_rows(rows)
+        self.status_var.set(f"Up to date ({time.strftime('%H:%M:%S')})")
+    
+    def _render_status_rows(self, rows):
+        """Update the status tree, touching only the rows whose value changed"""
+        previous = self._last_status_rows
+        index = 0
+        
+        for iid, _label in STATUS_ROWS:
+            value = rows.get(iid)
+            if value is None:
+                if iid in previous:
+                    self.status_tree.detach(iid)
+                continue
+            
+            if iid not in previous:
+                self.status_tree.reattach(iid, '', index)
+            if previous.get(iid) != value:
+                self.status_tree.set(iid, 'value', value)
+            index += 1
+        
+        self._last_status_rows = rows
+    
+    def _show_results(self, text):
+        """Replace the results text, leaving the widget alone if it is unchanged"""
+        if text == self._last_results:
+            return
+        
+        self.results_text.configure(state='normal')
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, text)
+        self.results_text.configure(state='disabled')
+        self._last_results = text
+    
+    def _set_busy(self, busy):
+        """
+        Enable or disable the local action buttons while a job is running
+        
+        Args:
+            busy (bool): True while a save, load or compare job is in progress
+        """
+        self._busy = busy
+        if busy and self._spinner_after is None:
+            self._spinner_step = 0
+            self._tick()
+        
+        if not self._actions_created:
+            return
+        
+        state = 'disabled' if busy else 'normal'
+        self.save_btn.configure(state=state)
+        self.compare_btn.configure(state=state)
+        
+        # Loading stays disabled for as long as read-only mode is active
+        self.load_btn.configure(state='disabled' if self.read_only_mode else state)
+    
+    def _tick(self):
+        """Advance the progress spinner, stopping once the job has finished"""
+        if not self._busy:
+            self._spinner_after = None
+            self._spinner_var.set("")
+            return
+        
+        frame = SPINNER_FRAMES[self._spinner_step % len(SPINNER_FRAMES)]
+        if self._progress is not None:
+            done, total = self._progress
+            self._spinner_var.set(f"[{frame}] Checked {done} of {total} files...")
+        else:
+            self._spinner_var.set(f"[{frame}] Working...")
+        self._spinner_step += 1
+        self._spinner_after = self.root.after(SPINNER_INTERVAL_MS, self._tick)
     
     def save_configuration(self):
         """Save current configuration to a zip file"""
         # Get save location
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         default_name = f"orca_config_backup_{timestamp}.zip"
         
         filename = filedialog.asksaveasfilename(
             title="Save Configuration As...",
+            initialfile=default_name,
             defaultextension=".zip",
             filetypes=[("Zip files", "*.zip"), ("All files", "*.*")]
         )
@@ -284,36 +803,37 @@ class OrcaBackupGUI:
             return
         
         # Start progress
+        self._set_busy(True)
         self.progress_var.set("Saving configuration...")
-        self.progress_bar.start()
         
         def save_thread():
             try:
                 success = self.backup_tool.export_configuration(filename)
+                file_size = os.stat(filename).st_size if success else 0
                 
                 # Update UI in main thread
-                self.root.after(0, lambda: self.save_completed(success, filename, None))
+                self._post(lambda: self.save_completed(success, filename, file_size, None))
                 
             except Exception as e:
-                self.root.after(0, lambda: self.save_completed(False, filename, str(e)))
+                error = str(e)
+                self._post(lambda: self.save_completed(False, filename, 0, error))
         
-        threading.Thread(target=save_thread, daemon=True).start()
+        self._io_pool.submit(save_thread)
     
-    def save_completed(self, success, filename, error):
+    def save_completed(self, success, filename, size, error):
         """Handle save completion"""
-        self.progress_bar.stop()
+        self._set_busy(False)
         
         if success:
-            file_size = format_file_size(Path(filename).stat().st_size)
+            file_size = format_file_size(size)
             self.progress_var.set("Configuration saved successfully")
             
             result = f"Configuration saved successfully!\n\n"
             result += f"File: {filename}\n"
             result += f"Size: {file_size}\n"
-            result += f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            result += f"Date: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
             
-            self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(tk.END, result)
+            self._show_results(result)
             
             messagebox.showinfo("Success", "Configuration saved successfully!")
         else:
@@ -322,8 +842,7 @@ class OrcaBackupGUI:
             if error:
                 error_msg += f":\n{error}"
             
-            self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(tk.END, error_msg)
+            self._show_results(error_msg)
             
             messagebox.showerror("Error", error_msg)
     
@@ -346,42 +865,44 @@ class OrcaBackupGUI:
         
         # Show confirmation dialog
         if not messagebox.askyesno("Confirm Load", 
-                                  f"This will replace your current OrcaSlicer configuration with:\n{filename}\n\nA backup of your current configuration will be created automatically.\n\nDo you want to continue?"):
+                                  f"This will replace your current OrcaSlicer configuration with:\n{filename}\n\nA backup of your current configuration will be created automatically.\n\nDo you want to continue?",
+                                  parent=self.root):
             return
         
         # Start progress
+        self._set_busy(True)
         self.progress_var.set("Loading configuration...")
-        self.progress_bar.start()
         
         def load_thread():
             try:
                 success = self.backup_tool.import_configuration(filename, create_backup=True)
                 
                 # Update UI in main thread
-                self.root.after(0, lambda: self.load_completed(success, filename, None))
+                self._post(lambda: self.load_completed(success, filename, None))
                 
             except Exception as e:
-                self.root.after(0, lambda: self.load_completed(False, filename, str(e)))
+                error = str(e)
+                self._post(lambda: self.load_completed(False, filename, error))
         
-        threading.Thread(target=load_thread, daemon=True).start()
+        self._io_pool.submit(load_thread)
     
     def load_completed(self, success, filename, error):
         """Handle load completion"""
-        self.progress_bar.stop()
+        self._set_busy(False)
         
         if success:
+            self._info_cache = None
             self.progress_var.set("Configuration loaded successfully")
             
             result = f"Configuration loaded successfully!\n\n"
             result += f"From: {filename}\n"
-            result += f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            result += f"Date: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
             result += "Please restart OrcaSlicer to see the changes.\n"
             
-            self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(tk.END, result)
+            self._show_results(result)
             
             # Update status
-            self.update_status()
+            self.schedule_refresh()
             
             messagebox.showinfo("Success", "Configuration loaded successfully!\n\nPlease restart OrcaSlicer to see the changes.")
         else:
@@ -390,8 +911,7 @@ class OrcaBackupGUI:
             if error:
                 error_msg += f":\n{error}"
             
-            self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(tk.END, error_msg)
+            self._show_results(error_msg)
             
             messagebox.showerror("Error", error_msg)
     
@@ -406,36 +926,66 @@ class OrcaBackupGUI:
             return
         
         # Start progress
+        self._set_busy(True)
         self.progress_var.set("Comparing configurations...")
-        self.progress_bar.start()
+        self._progress = None
+        cancel_event = threading.Event()
+        self._compare_cancel = cancel_event
+        self.cancel_btn.configure(state='normal')
+        
+        def report_progress(done, total):
+            # Picked up by the spinner tick on the main thread
+            self._progress = (done, total)
         
         def compare_thread():
             try:
-                comparison = self.diff_tool.compare_with_backup(filename)
+                comparison = self.diff_tool.compare_with_backup(filename, report_progress, cancel_event)
                 
                 # Update UI in main thread
-                self.root.after(0, lambda: self.compare_completed(comparison, filename))
+                self._post(lambda: self.compare_completed(comparison, filename))
                 
             except Exception as e:
-                self.root.after(0, lambda: self.compare_failed(str(e)))
+                error = str(e)
+                self._post(lambda: self.compare_failed(error))
         
-        threading.Thread(target=compare_thread, daemon=True).start()
+        self._io_pool.submit(compare_thread)
+    
+    def cancel_compare(self):
+        """Ask a running comparison to stop"""
+        if self._compare_cancel is not None:
+            self._compare_cancel.set()
+            self.cancel_btn.configure(state='disabled')
+            self.progress_var.set("Cancelling comparison...")
+    
+    def _end_compare(self):
+        """Clear the progress and cancel state of a finished comparison"""
+        self._compare_cancel = None
+        self._progress = None
+        self.cancel_btn.configure(state='disabled')
     
     def compare_completed(self, comparison, filename):
         """Handle comparison completion"""
-        self.progress_bar.stop()
+        self._end_compare()
+        self._set_busy(False)
+        
+        if comparison.get('cancelled'):
+            self.progress_var.set("Comparison cancelled")
+            return
+        
         self.progress_var.set("Comparison completed")
         
         if 'error' in comparison:
-            self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(tk.END, f"ERROR: Comparison failed: {comparison['error']}")
+            self._show_results(f"ERROR: Comparison failed: {comparison['error']}")
             return
         
-        # Build detailed comparison report
-        report = f"Configuration Comparison Results\n"
-        report += "=" * 60 + "\n"
-        report += f"Backup file: {filename}\n"
-        report += f"Comparison date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        # Build detailed comparison report as a list of lines, joined once
+        parts = [
+            "Configuration Comparison Results",
+            "=" * 60,
+            f"Backup file: {filename}",
+            f"Comparison date: {time.strftime('%Y-%m-%d %H:%M:%S')}",
+            "",
+        ]
         
         # Summary
         total_current = len(comparison['current_files'])
@@ -445,49 +995,53 @@ class OrcaBackupGUI:
         only_current = len(comparison['only_in_current'])
         only_backup = len(comparison['only_in_backup'])
         
-        report += "Summary:\n"
-        report += f"   Current configuration files: {total_current}\n"
-        report += f"   Backup configuration files: {total_backup}\n"
-        report += f"   Common files: {total_common}\n"
-        report += f"   Files with differences: {total_different}\n"
-        report += f"   Only in current: {only_current}\n"
-        report += f"   Only in backup: {only_backup}\n\n"
+        parts += [
+            "Summary:",
+            f"   Current configuration files: {total_current}",
+            f"   Backup configuration files: {total_backup}",
+            f"   Common files: {total_common}",
+            f"   Files with differences: {total_different}",
+            f"   Only in current: {only_current}",
+            f"   Only in backup: {only_backup}",
+            "",
+        ]
         
         if total_different == 0 and only_current == 0 and only_backup == 0:
-            report += "Configurations are identical!\n"
+            parts.append("Configurations are identical!")
         else:
-            report += "Configurations have differences:\n\n"
+            parts += ["Configurations have differences:", ""]
             
             if comparison['different_files']:
-                report += "Files with differences:\n"
-                for diff in comparison['different_files']:
-                    report += f"   • {diff['file']} - {diff['reason']}\n"
-                    report += f"     Current: {format_file_size(diff['current_size'])}, "
-                    report += f"Backup: {format_file_size(diff['backup_size'])}\n"
-                report += "\n"
+                parts.append("Files with differences:")
+                parts.extend(
+                    f"   • {diff['file']} - {diff['reason']}\n"
+                    f"     Current: {format_file_size(diff['current_size'])}, "
+                    f"Backup: {format_file_size(diff['backup_size'])}"
+                    for diff in comparison['different_files']
+                )
+                parts.append("")
             
             if comparison['only_in_current']:
-                report += "Files only in current configuration:\n"
-                for file in sorted(comparison['only_in_current']):
-                    report += f"   • {file}\n"
-                report += "\n"
+                parts.append("Files only in current configuration:")
+                parts.extend(f"   • {file}" for file in sorted(comparison['only_in_current']))
+                parts.append("")
             
             if comparison['only_in_backup']:
-                report += "Files only in backup:\n"
-                for file in sorted(comparison['only_in_backup']):
-                    report += f"   • {file}\n"
-                report += "\n"
+                parts.append("Files only in backup:")
+                parts.extend(f"   • {file}" for file in sorted(comparison['only_in_backup']))
+                parts.append("")
         
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, report)
+        report = "\n".join(parts) + "\n"
+        
+        self._show_results(report)
     
     def compare_failed(self, error):
         """Handle comparison failure"""
-        self.progress_bar.stop()
+        self._end_compare()
+        self._set_busy(False)
         self.progress_var.set("Comparison failed")
         
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, f"ERROR: Comparison failed: {error}")
+        self._show_results(f"ERROR: Comparison failed: {error}")
     
     def authenticate_cloud(self):
         """Show cloud authentication dialog"""
@@ -495,8 +1049,9 @@ class OrcaBackupGUI:
             self.cloud_dialog = CloudStorageDialog(self.root)
         self.cloud_dialog.show_auth_dialog()
         
-        # Update cloud status after authentication
-        self.root.after(1000, self.update_cloud_status)
+        # Update cloud status on the next poll tick
+        self._cloud_status_dirty = True
+        self._request_poll()
     
     def upload_to_cloud(self):
         """Upload current configuration to cloud storage"""
@@ -618,39 +1173,35 @@ class OrcaBackupGUI:
         self.wait_for_orcaslicer_shutdown(warning_window, progress_var, progress_bar)
     
     def wait_for_orcaslicer_shutdown(self, warning_window, progress_var, progress_bar):
-        """Wait for OrcaSlicer to shut down with periodic checking"""
-        def check_shutdown():
-            result = self.process_detector.wait_for_shutdown(max_wait_seconds=20, check_interval=2)
-            
-            if result['shutdown']:
-                # OrcaSlicer shut down successfully
-                warning_window.destroy()
-                messagebox.showinfo("Ready", 
-                                  f"OrcaSlicer has been closed. Ready to proceed!\n"
-                                  f"Shutdown detected after {result['time_waited']:.1f} seconds.")
-            else:
-                # Timeout reached
-                progress_bar.stop()
-                progress_var.set("OrcaSlicer still running after 20 seconds")
-                messagebox.showwarning("Still Running", 
-                                     "OrcaSlicer is still running after 20 seconds of waiting.\n"
-                                     "You can continue in backup/read-only mode or manually close OrcaSlicer.")
-        
-        # Run the check in a separate thread to avoid freezing the GUI
-        threading.Thread(target=check_shutdown, daemon=True).start()
+        """Wait for OrcaSlicer to shut down, woken by its exit or probing as a fallback"""
+        self._shutdown_wait = {
+            'window': warning_window,
+            'progress_var': progress_var,
+            'progress_bar': progress_bar,
+            'started': time.monotonic(),
+            'manual': False,
+            'timed_out': False,
+            # Periodic probes are paused while the exit watcher is waiting
+            'watching': True,
+        }
+        threading.Thread(target=self._watch_orcaslicer_exit, args=(self._shutdown_wait,),
+                         daemon=True).start()
     
     def manual_check_orcaslicer(self, warning_window):
         """Manual check if OrcaSlicer is still running"""
-        if not self.process_detector.is_orcaslicer_running():
-            warning_window.destroy()
-            messagebox.showinfo("Ready", "OrcaSlicer has been closed. Ready to proceed!")
-        else:
-            messagebox.showinfo("Still Running", 
-                               "OrcaSlicer is still running. Please close it to continue with full functionality.")
+        if self._shutdown_wait is None:
+            return
+        # Answered by the next probe; one already in flight counts as this check
+        self._shutdown_wait['manual'] = True
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+            self._poll_job = None
+        self._request_poll(0)
     
     def enable_readonly_mode(self, warning_window):
         """Enable read-only mode and close warning"""
         self.read_only_mode = True
+        self._shutdown_wait = None
         warning_window.destroy()
         
         # Update UI to show read-only mode
@@ -663,6 +1214,8 @@ class OrcaBackupGUI:
     
     def update_ui_for_readonly_mode(self):
         """Update UI elements for read-only mode"""
+        self._create_action_sections()
+        
         # Disable modification buttons
         self.load_btn.configure(state='disabled')
         self.upload_btn.configure(state='disabled')
@@ -674,10 +1227,13 @@ class OrcaBackupGUI:
         self.root.title("OrcaSlicer Configuration Manager (Read-Only Mode)")
         
         # Update status to show read-only mode
-        self.update_status()
+        self.schedule_refresh()
     
     def run(self):
         """Start the GUI application"""
+        # Start the first scan right away; the window paints the placeholder
+        # while it runs instead of waiting for the refresh debounce
+        self.update_status()
         self.root.mainloop()
 
 def main():
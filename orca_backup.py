@@ -9,14 +9,32 @@ import shutil
 import tempfile
 from pathlib import Path
 from datetime import datetime
-from utils import OrcaSlicerPaths, FileValidator
+from utils import OrcaSlicerPaths, FileValidator, scan_tree
+
+# Buffer size used when streaming members out of a backup zip
+EXTRACT_BUFFER_SIZE = 1 << 20
+# Buffer size used when streaming files into a backup zip
+ARCHIVE_BUFFER_SIZE = 1 << 20
+
+# Per-member Deflate level: public as ZipInfo.compress_level from Python 3.13,
+# before that only the attribute ZipFile.write() sets internally exists
+_ZINFO_LEVEL_ATTR = 'compress_level' if hasattr(zipfile.ZipInfo, 'compress_level') else '_compresslevel'
 
 class OrcaBackup:
     """Main class handling OrcaSlicer configuration backup and restore operations"""
     
+    _shared = None
+    
     def __init__(self):
         self.paths = OrcaSlicerPaths()
         self.validator = FileValidator()
+    
+    @classmethod
+    def shared(cls):
+        """Get the process-wide instance used by the CLI, GUI and cloud dialogs"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
         
     def detect_installation(self):
         """
@@ -33,15 +51,12 @@ class OrcaBackup:
         
         return None, None
     
-    def export_configuration(self, output_file):
+    def _get_export_source(self):
         """
-        Export current OrcaSlicer configuration to a zip file
+        Locate the configuration to export, raising if it is missing or empty
         
-        Args:
-            output_file (str): Path to output zip file
-            
         Returns:
-            bool: True if successful, False otherwise
+            tuple: (installation_path, config_path)
         """
         install_path, config_path = self.detect_installation()
         
@@ -52,40 +67,88 @@ class OrcaBackup:
         if not any(config_path.iterdir()):
             raise RuntimeError("OrcaSlicer configuration directory is empty. Please run OrcaSlicer at least once to create configuration files.")
         
+        return install_path, config_path
+    
+    def _write_backup(self, target, install_path, config_path, compresslevel=None):
+        """
+        Write the backup zip for a configuration directory
+        
+        Args:
+            target: Path or writable binary file object for the zip
+            install_path (Path): OrcaSlicer installation path, if known
+            config_path (Path): Configuration directory to back up
+            compresslevel (int): Deflate level 0-9, or None for the zlib default
+        """
+        with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zipf:
+            # Add metadata
+            metadata = {
+                'export_date': datetime.now().isoformat(),
+                'platform': sys.platform,
+                'config_path': str(config_path),
+                'install_path': str(install_path) if install_path else 'unknown'
+            }
+            
+            zipf.writestr('backup_metadata.txt', 
+                         '\n'.join([f"{k}: {v}" for k, v in metadata.items()]))
+            
+            # Add all configuration files and directories
+            for root, dirs, files in os.walk(config_path):
+                # Skip cache and temporary directories
+                dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['cache', 'temp', 'logs']]
+                
+                for file in files:
+                    if file.startswith('.'):
+                        continue
+                        
+                    file_path = Path(root) / file
+                    arc_path = file_path.relative_to(config_path)
+                    
+                    try:
+                        self._archive_file(zipf, file_path, f"config/{arc_path}", compresslevel)
+                    except (OSError, IOError) as e:
+                        print(f"Warning: Could not backup file {file_path}: {e}")
+    
+    def _archive_file(self, zipf, file_path, arcname, compresslevel=None):
+        """
+        Add one file to an open zip, copying in ARCHIVE_BUFFER_SIZE blocks
+        
+        Same result as zipf.write(), which copies through an 8 KiB buffer.
+        
+        Args:
+            zipf (zipfile.ZipFile): Zip open for writing
+            file_path (Path): File to add
+            arcname (str): Name inside the archive
+            compresslevel (int): Deflate level the zip was opened with, or None
+        """
+        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+        zinfo.compress_type = zipf.compression
+        setattr(zinfo, _ZINFO_LEVEL_ATTR, compresslevel)
+        
+        with open(file_path, 'rb') as src:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            with zipf.open(zinfo, 'w') as dest:
+                shutil.copyfileobj(src, dest, ARCHIVE_BUFFER_SIZE)
+    
+    def export_configuration(self, output_file):
+        """
+        Export current OrcaSlicer configuration to a zip file
+        
+        Args:
+            output_file (str): Path to output zip file
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        install_path, config_path = self._get_export_source()
+        
         try:
             # Create output directory if it doesn't exist
             output_path = Path(output_file)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Create zip file with configuration
-            with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # Add metadata
-                metadata = {
-                    'export_date': datetime.now().isoformat(),
-                    'platform': sys.platform,
-                    'config_path': str(config_path),
-                    'install_path': str(install_path) if install_path else 'unknown'
-                }
-                
-                zipf.writestr('backup_metadata.txt', 
-                             '\n'.join([f"{k}: {v}" for k, v in metadata.items()]))
-                
-                # Add all configuration files and directories
-                for root, dirs, files in os.walk(config_path):
-                    # Skip cache and temporary directories
-                    dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['cache', 'temp', 'logs']]
-                    
-                    for file in files:
-                        if file.startswith('.'):
-                            continue
-                            
-                        file_path = Path(root) / file
-                        arc_path = file_path.relative_to(config_path)
-                        
-                        try:
-                            zipf.write(file_path, f"config/{arc_path}")
-                        except (OSError, IOError) as e:
-                            print(f"Warning: Could not backup file {file_path}: {e}")
+            self._write_backup(output_file, install_path, config_path)
             
             # Verify the created zip file
             if not self.validator.validate_backup_zip(output_file):
@@ -102,13 +165,70 @@ class OrcaBackup:
                     pass
             raise RuntimeError(f"Failed to create backup: {e}")
     
-    def import_configuration(self, zip_file, create_backup=True):
+    def export_configuration_stream(self, fileobj, compresslevel=None):
+        """
+        Export current OrcaSlicer configuration as a zip written to a file object
+        
+        Args:
+            fileobj: Writable binary file object; it is validated afterwards
+                if it is also readable and seekable
+            compresslevel (int): Deflate level 0-9, or None for the zlib default
+            
+        Returns:
+            bool: True if successful
+        """
+        install_path, config_path = self._get_export_source()
+        
+        try:
+            start = fileobj.tell() if fileobj.seekable() else 0
+            self._write_backup(fileobj, install_path, config_path, compresslevel)
+            
+            if fileobj.readable() and fileobj.seekable():
+                end = fileobj.tell()
+                fileobj.seek(start)
+                if not self.validator.validate_backup_zip(fileobj):
+                    raise RuntimeError("Created backup failed validation")
+                fileobj.seek(end)
+            
+            return True
+            
+        except Exception as e:
+            raise RuntimeError(f"Failed to create backup: {e}")
+    
+    def _extract_all(self, zipf, target_dir, buffer_size):
+        """
+        Extract every member of an open zip, streaming file data in large blocks
+        
+        Args:
+            zipf (zipfile.ZipFile): Open backup archive
+            target_dir (Path): Directory to extract into
+            buffer_size (int): Bytes copied per read
+        """
+        root = target_dir.resolve()
+        
+        for member in zipf.infolist():
+            target = (root / member.filename).resolve()
+            
+            # Refuse members that would land outside the extraction directory
+            if target != root and root not in target.parents:
+                raise RuntimeError(f"Invalid backup file: unsafe path '{member.filename}'")
+            
+            if member.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with zipf.open(member) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, buffer_size)
+    
+    def import_configuration(self, zip_file, create_backup=True, buffer_size=EXTRACT_BUFFER_SIZE):
         """
         Import OrcaSlicer configuration from a zip file
         
         Args:
             zip_file (str): Path to backup zip file
             create_backup (bool): Whether to create backup of current config
+            buffer_size (int): Bytes copied per read when extracting files
             
         Returns:
             bool: True if successful, False otherwise
@@ -145,7 +265,7 @@ class OrcaBackup:
                 
                 # Extract zip file
                 with zipfile.ZipFile(zip_file, 'r') as zipf:
-                    zipf.extractall(temp_path)
+                    self._extract_all(zipf, temp_path, buffer_size)
                 
                 # Verify extraction
                 config_source = temp_path / "config"
@@ -176,7 +296,8 @@ class OrcaBackup:
             if backup_path and backup_path.exists():
                 try:
                     print("Import failed, attempting to restore backup...")
-                    self.import_configuration(str(backup_path), create_backup=False)
+                    self.import_configuration(str(backup_path), create_backup=False,
+                                              buffer_size=buffer_size)
                     print("Backup restored successfully")
                 except:
                     print("Failed to restore backup. Manual intervention may be required.")
@@ -203,17 +324,7 @@ class OrcaBackup:
         
         if config_path and config_path.exists():
             try:
-                total_size = 0
-                file_count = 0
-                
-                for root, dirs, files in os.walk(config_path):
-                    for file in files:
-                        file_path = Path(root) / file
-                        try:
-                            total_size += file_path.stat().st_size
-                            file_count += 1
-                        except:
-                            pass
+                file_count, total_size = scan_tree(config_path)
                 
                 info['config_size'] = total_size
                 info['file_count'] = file_count
@@ -0,0 +1,94 @@
+"""
+Tests for the non-interactive command line entry point
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cli
+from orca_backup import OrcaBackup
+
+
+class _StubBackupTool:
+    """Backup tool double that records calls and returns a fixed result"""
+
+    def __init__(self, result, export_data=b'PK'):
+        self.result = result
+        self.export_data = export_data
+        self.calls = []
+
+    def export_configuration(self, filename):
+        self.calls.append(('export', filename))
+        if self.result:
+            Path(filename).write_bytes(self.export_data)
+        return self.result
+
+    def import_configuration(self, filename, create_backup):
+        self.calls.append(('import', filename, create_backup))
+        return self.result
+
+
+class MainExitCodeTest(unittest.TestCase):
+    """main(argv) exits 0 on success and 1 on failure"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.zip_path = str(Path(self.temp_dir.name) / 'backup.zip')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _run(self, argv, result):
+        tool = _StubBackupTool(result)
+        with mock.patch.object(OrcaBackup, 'shared', return_value=tool), \
+                mock.patch.object(cli.CLIInterface, 'run_interactive') as interactive, \
+                contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaises(SystemExit) as cm:
+                cli.main(argv)
+        interactive.assert_not_called()
+        return cm.exception.code, tool.calls
+
+    def test_export_success(self):
+        code, calls = self._run(['export', self.zip_path], True)
+        self.assertEqual(code, 0)
+        self.assertEqual(calls, [('export', self.zip_path)])
+
+    def test_export_failure(self):
+        code, _ = self._run(['export', self.zip_path], False)
+        self.assertEqual(code, 1)
+
+    def test_import_success_backs_up_by_default(self):
+        code, calls = self._run(['import', self.zip_path], True)
+        self.assertEqual(code, 0)
+        self.assertEqual(calls, [('import', self.zip_path, True)])
+
+    def test_import_failure_with_no_backup(self):
+        code, calls = self._run(['import', self.zip_path, '--no-backup'], False)
+        self.assertEqual(code, 1)
+        self.assertEqual(calls, [('import', self.zip_path, False)])
+
+    def test_exception_in_backup_tool_exits_1(self):
+        tool = _StubBackupTool(True)
+        tool.import_configuration = mock.Mock(side_effect=RuntimeError("corrupt zip"))
+        with mock.patch.object(OrcaBackup, 'shared', return_value=tool), \
+                contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaises(SystemExit) as cm:
+                cli.main(['import', self.zip_path])
+        self.assertEqual(cm.exception.code, 1)
+
+    def test_no_command_runs_interactive(self):
+        with mock.patch.object(cli.CLIInterface, 'run_interactive') as interactive:
+            cli.main([])
+        interactive.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
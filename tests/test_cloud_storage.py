@@ -0,0 +1,113 @@
+"""
+Tests for stored cloud credentials and tokens
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cloud_storage
+from cloud_storage import CredentialStore, GoogleDriveManager
+
+
+class CredentialStoreTest(unittest.TestCase):
+    """CredentialStore tracks changes and replaces its file atomically"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / 'manager' / 'credentials.json'
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        store = CredentialStore(self.path)
+        self.assertEqual(store.credentials, {})
+        store.set('google_drive', True)
+        store.set('google_drive_folder_id', 'abc123')
+        store.save()
+
+        reloaded = CredentialStore(self.path)
+        self.assertEqual(reloaded.credentials,
+                         {'google_drive': True, 'google_drive_folder_id': 'abc123'})
+
+    def test_unchanged_value_does_not_mark_dirty(self):
+        store = CredentialStore(self.path)
+        store.set('icloud', True)
+        store.save()
+        self.assertFalse(store.dirty)
+
+        store.set('icloud', True)
+        self.assertFalse(store.dirty)
+        with mock.patch.object(cloud_storage.os, 'replace') as replace:
+            store.save()
+        replace.assert_not_called()
+
+    def test_changed_value_marks_dirty_until_saved(self):
+        store = CredentialStore(self.path)
+        store.set('icloud', True)
+        self.assertTrue(store.dirty)
+        store.save()
+        self.assertFalse(store.dirty)
+
+        store.set('icloud', False)
+        self.assertTrue(store.dirty)
+
+    def test_failed_save_keeps_previous_file(self):
+        store = CredentialStore(self.path)
+        store.set('icloud', True)
+        store.save()
+        before = self.path.read_bytes()
+
+        store.set('icloud', False)
+        with mock.patch.object(cloud_storage.os, 'replace', side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                store.save()
+
+        self.assertEqual(self.path.read_bytes(), before)
+        # Still dirty, so the next save retries
+        self.assertTrue(store.dirty)
+
+    def test_unreadable_file_loads_as_empty(self):
+        self.path.parent.mkdir(parents=True)
+        self.path.write_bytes(b'{not json')
+        self.assertEqual(CredentialStore(self.path).credentials, {})
+
+
+class SaveTokenTest(unittest.TestCase):
+    """GoogleDriveManager._save_token never leaves a truncated token behind"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.token_file = Path(self.temp_dir.name) / 'token.json'
+        # Skip __init__, which needs a Tk root and the Google client libraries
+        self.manager = GoogleDriveManager.__new__(GoogleDriveManager)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _creds(self, token):
+        return SimpleNamespace(to_json=lambda: '{"token": "%s"}' % token)
+
+    def test_replaces_existing_token(self):
+        self.token_file.write_text('{"token": "old"}')
+        self.manager._save_token(self.token_file, self._creds('new'))
+        self.assertEqual(self.token_file.read_text(), '{"token": "new"}')
+        self.assertFalse(self.token_file.with_suffix('.tmp').exists())
+
+    def test_failed_replace_keeps_old_token(self):
+        self.token_file.write_text('{"token": "old"}')
+        with mock.patch.object(cloud_storage.os, 'replace', side_effect=OSError("read-only")):
+            self.manager._save_token(self.token_file, self._creds('new'))
+        self.assertEqual(self.token_file.read_text(), '{"token": "old"}')
+        self.assertFalse(self.token_file.with_suffix('.tmp').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
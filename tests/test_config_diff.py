@@ -0,0 +1,120 @@
+"""
+Tests for comparing the current configuration with a backup
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orca_backup import OrcaBackup
+from gui import ConfigDiff, QUICK_CHECK_MIN_SIZE
+
+
+class _ConfigDirTool:
+    """Backup tool double that reports a fixed configuration directory"""
+
+    def __init__(self, config_path):
+        self.config_path = config_path
+
+    def get_config_info(self):
+        return {'config_found': True, 'config_path': str(self.config_path)}
+
+
+class CompareWithBackupTest(unittest.TestCase):
+    """ConfigDiff.compare_with_backup against a backup of the same tree"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.config = root / 'OrcaSlicer'
+        (self.config / 'user' / 'default').mkdir(parents=True)
+        self.small = self.config / 'user' / 'default' / 'filament.json'
+        self.small.write_bytes(b'{"temperature": 210}\n')
+        self.large = self.config / 'user' / 'default' / 'model.3mf'
+        self.large.write_bytes(os.urandom(QUICK_CHECK_MIN_SIZE * 2))
+        (self.config / 'OrcaSlicer.conf').write_bytes(b'[app]\nversion = 2\n')
+
+        self.backup_file = root / 'backup.zip'
+        OrcaBackup()._write_backup(self.backup_file, None, self.config)
+        self.diff = ConfigDiff(_ConfigDirTool(self.config))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _compare(self):
+        result = self.diff.compare_with_backup(str(self.backup_file))
+        self.assertNotIn('error', result)
+        return {d['file']: d['reason'] for d in result['different_files']}
+
+    def _rewrite(self, path, data, keep_mtime=False):
+        """Replace a file's contents in place, optionally restoring its old mtime"""
+        st = os.stat(path)
+        # Let the coarse filesystem clock move past the previous scan
+        time.sleep(0.05)
+        with open(path, 'r+b') as f:
+            f.write(data)
+        if keep_mtime:
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    def test_identical_tree_has_no_differences(self):
+        self.assertEqual(self._compare(), {})
+        # Second run answers from the CRC cache
+        self.assertEqual(self._compare(), {})
+
+    def test_same_size_edit_is_detected(self):
+        self._rewrite(self.small, b'{"temperature": 215}\n')
+        self.assertEqual(self._compare(), {'user/default/filament.json': 'Different content'})
+
+    def test_edit_with_preserved_mtime_is_detected(self):
+        # A warm cache must not hide a restore that put the old mtime back
+        self.assertEqual(self._compare(), {})
+        self._rewrite(self.small, b'{"temperature": 199}\n', keep_mtime=True)
+        self.assertEqual(self._compare(), {'user/default/filament.json': 'Different content'})
+
+    def test_newer_file_with_same_content_is_unchanged(self):
+        future = time.time() + 3600
+        os.utime(self.small, (future, future))
+        self.assertEqual(self._compare(), {})
+
+    def test_newer_file_with_new_content_is_detected(self):
+        self._rewrite(self.small, b'{"temperature": 230}\n')
+        future = time.time() + 3600
+        os.utime(self.small, (future, future))
+        self.assertEqual(self._compare(), {'user/default/filament.json': 'Different content'})
+
+    def test_large_file_edit_past_the_head_is_detected(self):
+        # No size cutoff: a change beyond the quick head check still counts
+        with open(self.large, 'r+b') as f:
+            f.seek(-1, os.SEEK_END)
+            last = f.read(1)
+            f.seek(-1, os.SEEK_END)
+            f.write(bytes([last[0] ^ 0xFF]))
+        self.assertEqual(self._compare(), {'user/default/model.3mf': 'Different content'})
+
+    def test_size_change_and_added_and_removed_files(self):
+        self.small.write_bytes(b'{}\n')
+        (self.config / 'new.json').write_bytes(b'{}')
+        (self.config / 'OrcaSlicer.conf').unlink()
+
+        result = self.diff.compare_with_backup(str(self.backup_file))
+        reasons = {d['file']: d['reason'] for d in result['different_files']}
+        self.assertEqual(reasons, {'user/default/filament.json': 'Different file sizes'})
+        self.assertEqual(result['only_in_current'], {'new.json'})
+        self.assertEqual(set(result['only_in_backup']), {'OrcaSlicer.conf'})
+
+    def test_crc_cache_is_invalidated_by_an_edit(self):
+        self.assertEqual(self._compare(), {})
+        self._rewrite(self.small, b'{"temperature": 205}\n')
+        self.assertEqual(self._compare(), {'user/default/filament.json': 'Different content'})
+        # And picks up the new contents once the file matches the backup again
+        self._rewrite(self.small, b'{"temperature": 210}\n')
+        self.assertEqual(self._compare(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Tests for backup archive writing and extraction
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orca_backup import OrcaBackup
+
+
+class ArchiveFileTest(unittest.TestCase):
+    """OrcaBackup._archive_file writes the same member as ZipFile.write()"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.source = self.root / 'profile.json'
+        # Compressible but not trivially so, and larger than the copy buffer
+        self.source.write_bytes(b''.join(b'{"layer_height": %d}\n' % i for i in range(200000)))
+        self.backup = OrcaBackup()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_zip(self, name, compresslevel, use_archive_file):
+        path = self.root / name
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zipf:
+            if use_archive_file:
+                self.backup._archive_file(zipf, self.source, 'config/profile.json', compresslevel)
+            else:
+                zipf.write(self.source, 'config/profile.json')
+        return path
+
+    def test_matches_zipfile_write(self):
+        for level in (None, 1, 9):
+            with self.subTest(compresslevel=level):
+                expected = self._write_zip('write.zip', level, use_archive_file=False)
+                actual = self._write_zip('archive.zip', level, use_archive_file=True)
+                self.assertEqual(actual.read_bytes(), expected.read_bytes())
+
+    def test_level_is_applied(self):
+        fast = self._write_zip('fast.zip', 1, use_archive_file=True)
+        best = self._write_zip('best.zip', 9, use_archive_file=True)
+        with zipfile.ZipFile(fast) as f, zipfile.ZipFile(best) as b:
+            self.assertGreater(f.getinfo('config/profile.json').compress_size,
+                               b.getinfo('config/profile.json').compress_size)
+            self.assertEqual(b.read('config/profile.json'), self.source.read_bytes())
+
+
+class ExtractAllTest(unittest.TestCase):
+    """OrcaBackup._extract_all unpacks backups and refuses escaping members"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.target = self.root / 'extract'
+        self.target.mkdir()
+        self.zip_path = self.root / 'backup.zip'
+        self.backup = OrcaBackup()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _make_zip(self, members):
+        with zipfile.ZipFile(self.zip_path, 'w') as zipf:
+            for name, data in members:
+                zipf.writestr(zipfile.ZipInfo(name), data)
+
+    def _extract(self):
+        with zipfile.ZipFile(self.zip_path) as zipf:
+            self.backup._extract_all(zipf, self.target, 4096)
+
+    def test_extracts_nested_members(self):
+        payload = os.urandom(10000)
+        self._make_zip([('config/', b''), ('config/user/a.json', b'{}'),
+                        ('config/user/b.bin', payload)])
+        self._extract()
+
+        self.assertEqual((self.target / 'config' / 'user' / 'a.json').read_bytes(), b'{}')
+        self.assertEqual((self.target / 'config' / 'user' / 'b.bin').read_bytes(), payload)
+
+    def test_rejects_parent_traversal(self):
+        self._make_zip([('config/ok.json', b'{}'), ('config/../../escaped.txt', b'x')])
+        with self.assertRaises(RuntimeError):
+            self._extract()
+        self.assertFalse((self.root / 'escaped.txt').exists())
+
+    def test_rejects_absolute_member(self):
+        outside = self.root / 'absolute.txt'
+        self._make_zip([(str(outside), b'x')])
+        with self.assertRaises(RuntimeError):
+            self._extract()
+        self.assertFalse(outside.exists())
+
+    def test_rejects_symlinked_directory_escape(self):
+        if not hasattr(os, 'symlink'):
+            self.skipTest("symlinks not supported")
+        outside = self.root / 'outside'
+        outside.mkdir()
+        os.symlink(outside, self.target / 'config')
+        self._make_zip([('config/planted.json', b'{}')])
+        with self.assertRaises(RuntimeError):
+            self._extract()
+        self.assertFalse((outside / 'planted.json').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Tests for backup validation helpers
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils
+from utils import FileValidator
+
+
+class GetBackupInfoCacheTest(unittest.TestCase):
+    """FileValidator.get_backup_info reuses metadata of unchanged backups"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.zip_path = os.path.join(self.temp_dir.name, 'backup.zip')
+        with zipfile.ZipFile(self.zip_path, 'w') as zipf:
+            zipf.writestr('backup_metadata.txt',
+                          "export_date: 2024-01-01T00:00:00\n"
+                          "platform: linux\n"
+                          "install_path: unknown")
+            zipf.writestr('config/user/a.json', '{}')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_second_call_is_cache_hit(self):
+        validator = FileValidator()
+        first = validator.get_backup_info(self.zip_path)
+
+        self.assertEqual(first['platform'], 'linux')
+        self.assertEqual(first['file_count'], 1)
+        self.assertEqual(list(validator._backup_info_cache),
+                         [validator._backup_info_key(self.zip_path)])
+
+        # A hit must not open the archive again
+        with mock.patch.object(utils.zipfile, 'ZipFile', side_effect=AssertionError("zip reopened")):
+            second = validator.get_backup_info(self.zip_path)
+
+        self.assertEqual(second, first)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,8 +4,10 @@ Utility classes and functions for OrcaSlicer path detection and file validation
 
 import os
 import sys
-import time
+import select
 import zipfile
+import functools
+from collections import OrderedDict
 from pathlib import Path
 
 try:
@@ -133,17 +135,38 @@ class OrcaSlicerPaths:
 class FileValidator:
     """Validate backup files and configurations"""
     
+    # Maximum number of backups whose metadata is remembered
+    BACKUP_INFO_CACHE_SIZE = 32
+    
+    def __init__(self):
+        self._backup_info_cache = OrderedDict()
+    
+    def _backup_info_key(self, zip_path):
+        """Identify a backup by path, mtime and size, or None if it can't be stat'ed"""
+        try:
+            if hasattr(zip_path, 'fileno'):
+                st = os.fstat(zip_path.fileno())
+                name = getattr(zip_path, 'name', None)
+                if not isinstance(name, (str, os.PathLike)):
+                    return None
+            else:
+                st = os.stat(zip_path)
+                name = zip_path
+        except (OSError, ValueError):
+            return None
+        return (os.path.abspath(name), st.st_mtime_ns, st.st_size)
+    
     def validate_backup_zip(self, zip_path):
         """
         Validate that a zip file is a valid OrcaSlicer backup
         
         Args:
-            zip_path (str): Path to zip file
+            zip_path (str or file-like): Path to zip file or an open binary handle
             
         Returns:
             bool: True if valid, False otherwise
         """
-        if not Path(zip_path).exists():
+        if isinstance(zip_path, (str, os.PathLike)) and not Path(zip_path).exists():
             return False
         
         try:
@@ -172,11 +195,16 @@ class FileValidator:
         Get information from backup metadata
         
         Args:
-            zip_path (str): Path to backup zip file
+            zip_path (str or file-like): Path to backup zip file or an open binary handle
             
         Returns:
             dict: Backup information
         """
+        cache_key = self._backup_info_key(zip_path)
+        if cache_key is not None and cache_key in self._backup_info_cache:
+            self._backup_info_cache.move_to_end(cache_key)
+            return dict(self._backup_info_cache[cache_key])
+        
         info = {}
         
         try:
@@ -195,8 +223,80 @@ class FileValidator:
         except Exception as e:
             info['error'] = str(e)
         
+        # Only successful reads are cached so a failed read is retried
+        if cache_key is not None and 'error' not in info:
+            self._backup_info_cache[cache_key] = dict(info)
+            if len(self._backup_info_cache) > self.BACKUP_INFO_CACHE_SIZE:
+                self._backup_info_cache.popitem(last=False)
+        
         return info
 
+def scan_tree(path):
+    """
+    Count files and sum their sizes under a directory tree in one os.scandir walk
+    
+    Args:
+        path (str or Path): Directory to scan
+        
+    Returns:
+        tuple: (file_count, total_size)
+    """
+    file_count = 0
+    total_size = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        # Same view as export's os.walk: symlinked directories are
+                        # neither counted nor descended, file links count their target
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                stack.append(entry.path)
+                            continue
+                        total_size += entry.stat().st_size
+                        file_count += 1
+                    except OSError:
+                        # Broken link or removed while scanning
+                        pass
+        except OSError:
+            pass
+    return file_count, total_size
+
+def iter_files(root):
+    """
+    Walk a directory tree with os.scandir, yielding every file
+    
+    Matches what export archives: symlinks to files are included, symlinked
+    directories are not descended and broken links are left out.
+    
+    Args:
+        root (str or Path): Directory to walk
+        
+    Yields:
+        tuple: (relative path using '/' separators, os.DirEntry)
+    """
+    stack = [(root, '')]
+    while stack:
+        base, prefix = stack.pop()
+        try:
+            with os.scandir(base) as it:
+                for entry in it:
+                    rel_path = prefix + entry.name
+                    try:
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                stack.append((entry.path, rel_path + '/'))
+                        elif entry.is_file():
+                            yield rel_path, entry
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+
+@functools.lru_cache(maxsize=1024)
 def format_file_size(size_bytes):
     """
     Format file size in human readable format
@@ -218,6 +318,8 @@ class OrcaSlicerProcessDetector:
     
     def __init__(self):
         self.process_names = ['orcaslicer', 'orcaslicer.exe', 'OrcaSlicer', 'OrcaSlicer.exe']
+        # Lowercased once so each probe is a set lookup per process
+        self._match_names = frozenset(name.lower() for name in self.process_names)
     
     def is_orcaslicer_running(self):
         """
@@ -231,24 +333,12 @@ class OrcaSlicerProcessDetector:
             return self._fallback_process_check()
         
         try:
-            import psutil as ps
-            for process in ps.process_iter(['name', 'exe']):
-                try:
-                    process_info = process.info
-                    process_name = process_info.get('name', '').lower()
-                    process_exe = process_info.get('exe', '')
-                    
-                    # Check process name
-                    if any(name.lower() in process_name for name in self.process_names):
-                        return True
-                    
-                    # Check executable path
-                    if process_exe and any(name.lower() in process_exe.lower() for name in self.process_names):
-                        return True
-                        
-                except (Exception):
-                    # Handle any psutil exceptions
-                    continue
+            # Only the name is fetched; reading every process's exe costs a
+            # syscall each and is often denied for other users' processes
+            for process in psutil.process_iter(['name']):
+                name = process.info.get('name') or ''
+                if name.lower() in self._match_names:
+                    return True
                     
         except Exception:
             # If psutil fails, fallback to OS commands
@@ -256,6 +346,82 @@ class OrcaSlicerProcessDetector:
         
         return False
     
+    def find_orcaslicer_pid(self):
+        """
+        Find the process id of a running OrcaSlicer
+        
+        Returns:
+            int: PID of the first matching process, or None if none is found or
+                psutil is not available
+        """
+        if not PSUTIL_AVAILABLE:
+            return None
+        
+        try:
+            for process in psutil.process_iter(['name']):
+                name = process.info.get('name') or ''
+                if name.lower() in self._match_names:
+                    return process.pid
+        except Exception:
+            pass
+        
+        return None
+    
+    def wait_for_exit(self, pid, timeout=None):
+        """
+        Block until a process exits, without polling where the OS can notify
+        
+        Uses a pidfd on Linux, kqueue on macOS/BSD and psutil's native wait
+        elsewhere (WaitForSingleObject on Windows).
+        
+        Args:
+            pid (int): Process to wait for
+            timeout (float): Maximum time to wait in seconds, or None for no limit
+            
+        Returns:
+            bool: True if it exited, False on timeout, None if it can't be waited on
+        """
+        if hasattr(os, 'pidfd_open'):
+            try:
+                fd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                return True
+            except OSError:
+                # Kernel without pidfd support; try the other ways
+                fd = None
+            if fd is not None:
+                try:
+                    poller = select.poll()
+                    poller.register(fd, select.POLLIN)
+                    return bool(poller.poll(None if timeout is None else int(timeout * 1000)))
+                finally:
+                    os.close(fd)
+        
+        if hasattr(select, 'kqueue'):
+            kq = select.kqueue()
+            try:
+                event = select.kevent(pid, filter=select.KQ_FILTER_PROC,
+                                      flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                                      fflags=select.KQ_NOTE_EXIT)
+                return bool(kq.control([event], 1, timeout))
+            except ProcessLookupError:
+                return True
+            finally:
+                kq.close()
+        
+        if PSUTIL_AVAILABLE:
+            try:
+                psutil.Process(pid).wait(timeout)
+                return True
+            except psutil.NoSuchProcess:
+                return True
+            except psutil.TimeoutExpired:
+                return False
+            except Exception:
+                return None
+        
+        return None
+    
     def _fallback_process_check(self):
         """Fallback process detection using OS commands"""
         import subprocess
@@ -288,34 +454,3 @@ class OrcaSlicerProcessDetector:
         except Exception:
             # If all else fails, assume not running
             return False
-    
-    def wait_for_shutdown(self, max_wait_seconds=20, check_interval=2):
-        """
-        Wait for OrcaSlicer to shut down with periodic checking
-        
-        Args:
-            max_wait_seconds (int): Maximum time to wait in seconds
-            check_interval (int): How often to check in seconds
-            
-        Returns:
-            dict: Result with 'shutdown' (bool) and 'time_waited' (float)
-        """
-        start_time = time.time()
-        checks_made = 0
-        
-        while time.time() - start_time < max_wait_seconds:
-            if not self.is_orcaslicer_running():
-                return {
-                    'shutdown': True,
-                    'time_waited': time.time() - start_time,
-                    'checks_made': checks_made
-                }
-            
-            checks_made += 1
-            time.sleep(check_interval)
-        
-        return {
-            'shutdown': False,
-            'time_waited': time.time() - start_time,
-            'checks_made': checks_made
-        }